@@ -8,6 +8,8 @@ components into a unified interface compatible with the original TopyazCLI.
 
 """
 
+from collections.abc import Callable
+from concurrent.futures import ThreadPoolExecutor
 from dataclasses import asdict
 from pathlib import Path
 from typing import Any
@@ -27,6 +29,26 @@ from topyaz.system.memory import MemoryManager
 from topyaz.utils.logging import setup_logging
 
 
+def _run_probes(probes: dict[str, Callable[[], Any]]) -> dict[str, Any]:
+    """
+    Run independent, read-only diagnostic probes concurrently.
+
+    The probes are dominated by subprocesses (``--version`` calls, GPU vendor
+    tools), so threads bring the wall-clock time down to the slowest probe
+    rather than the sum. An exception from any probe is re-raised.
+
+    Args:
+        probes: Mapping of result key to zero-argument probe
+
+    Returns:
+        Mapping of the same keys, in the same order, to probe results
+
+    """
+    with ThreadPoolExecutor(max_workers=len(probes)) as pool:
+        futures = {key: pool.submit(probe) for key, probe in probes.items()}
+        return {key: future.result() for key, future in futures.items()}
+
+
 class TopyazCLI:
     """
     Unified CLI wrapper for Topaz Labs products.
@@ -92,7 +114,6 @@ class TopyazCLI:
 
         # Set up executor
         logger.info("Using local execution")
-        # from topyaz.execution.base import ExecutorContext # Moved to top
 
         context = ExecutorContext(timeout=self._options.timeout, dry_run=self._options.dry_run)
         self._executor = LocalExecutor(context)
@@ -465,15 +486,21 @@ class TopyazCLI:
 
         """
         try:
+            # Products are created here, not lazily inside the worker threads
+            products = {"_gigapixel": self._gigapixel, "_video_ai": self._video_ai, "_photo_ai": self._photo_ai}
+            results = _run_probes(
+                {
+                    "environment": self._env_validator.get_system_info,
+                    "gpu": self._gpu_manager.get_status,
+                    "memory": self._memory_manager.check_constraints,
+                    **{name: product.get_info for name, product in products.items()},
+                }
+            )
             return {
-                "environment": self._env_validator.get_system_info(),
-                "gpu": asdict(self._gpu_manager.get_status()),
-                "memory": asdict(self._memory_manager.check_constraints()),
-                "products": {
-                    "_gigapixel": self._gigapixel.get_info(),
-                    "_video_ai": self._video_ai.get_info(),
-                    "_photo_ai": self._photo_ai.get_info(),
-                },
+                "environment": results["environment"],
+                "gpu": asdict(results["gpu"]),
+                "memory": asdict(results["memory"]),
+                "products": {name: results[name] for name in products},
                 "_executor": self._executor.get_info(),
             }
         except Exception as e:
@@ -513,13 +540,14 @@ class TopyazCLI:
 
         """
         try:
-            # from topyaz import __version__ # Moved to top as topyaz_version
-            return {
-                "topyaz": topyaz_version,
-                "_gigapixel": self._gigapixel.get_version() or "unknown",
-                "_video_ai": self._video_ai.get_version() or "unknown",
-                "_photo_ai": self._photo_ai.get_version() or "unknown",
-            }
+            versions = _run_probes(
+                {
+                    "_gigapixel": self._gigapixel.get_version,
+                    "_video_ai": self._video_ai.get_version,
+                    "_photo_ai": self._photo_ai.get_version,
+                }
+            )
+            return {"topyaz": topyaz_version, **{name: version or "unknown" for name, version in versions.items()}}
         except Exception as e:
             logger.error(f"Failed to get version info: {e}")
             return {"error": str(e)}
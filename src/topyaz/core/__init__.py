@@ -25,6 +25,7 @@ from topyaz.core.types import (
     GPUStatus,
     LogLevel,
     MemoryConstraints,
+    ParamSpec,
     PhotoAIParams,
     ProcessingOptions,
     ProcessingResult,
@@ -45,6 +46,7 @@ __all__ = [
     "GigapixelParams",
     "LogLevel",
     "MemoryConstraints",
+    "ParamSpec",
     "PhotoAIParams",
     "ProcessingError",
     "ProcessingOptions",
@@ -10,36 +10,68 @@ with support for nested keys and default values.
 """
 
 import os
+import pickle
 import platform as plat_global
+from collections.abc import Mapping
 from pathlib import Path
-from typing import Any, ClassVar  # Added ClassVar
+from types import MappingProxyType
+from typing import IO, Any
 
 import yaml
 from loguru import logger
 
 from topyaz.core.types import ConfigDict
 
+# Prefer the LibYAML-backed loader and dumper when PyYAML was built with them; they
+# parse and emit in native code and are noticeably faster than the pure-Python
+# SafeLoader/SafeDumper.
+_YAML_LOADER = getattr(yaml, "CSafeLoader", yaml.SafeLoader)
+_YAML_DUMPER = getattr(yaml, "CSafeDumper", yaml.SafeDumper)
+
+# Loaded config files keyed by (resolved path, st_mtime_ns, st_size). Repeated
+# Config() constructions in one process (tests, batch runs, TopyazCLI instances)
+# then cost a stat() instead of a YAML parse; editing the file changes the key.
+# Entries are pickled merged configs: each caller gets a private copy from one
+# C-level pickle.loads() instead of a copy.deepcopy() walk in Python.
+_CONFIG_CACHE: dict[tuple[str, int, int], bytes] = {}
+
+# Environment variables read as configuration overrides
+ENV_PREFIX = "TOPYAZ_"
+
+# Lower-cased environment strings that parse as booleans, resolved in one lookup
+_ENV_BOOLEANS: Mapping[str, bool] = MappingProxyType(
+    {
+        **dict.fromkeys(("true", "yes", "1", "on"), True),
+        **dict.fromkeys(("false", "no", "0", "off"), False),
+    }
+)
 
-class Config:
-    """
-    Manages topyaz configuration from files and environment.
 
-    Configuration is loaded from:
-    1. Default values (hardcoded)
-    2. System _config file (~/.topyaz/_config.yaml)
-    3. User-specified _config file
-    4. Environment variables (TOPYAZ_* prefix)
+def _freeze(config: ConfigDict) -> Mapping[str, Any]:
+    """Wrap a nested configuration dict in read-only mapping proxies."""
+    return MappingProxyType(
+        {key: _freeze(value) if isinstance(value, dict) else value for key, value in config.items()}
+    )
 
-    Configuration keys can be accessed using dot notation:
-        _config.get("video.default_model")
-        _config.get("defaults.output_dir", "~/processed")
 
-    Used in:
-    - topyaz/cli.py
-    - topyaz/core/__init__.py
-    """
+def _thaw(config: Mapping[str, Any]) -> ConfigDict:
+    """Copy a (possibly read-only) configuration mapping into plain, mutable dicts and lists."""
+    copied: ConfigDict = {}
+    for key, value in config.items():
+        if isinstance(value, Mapping):
+            copied[key] = _thaw(value)
+        elif isinstance(value, list):
+            copied[key] = list(value)
+        else:
+            copied[key] = value
+    return copied
+
 
-    DEFAULT_CONFIG: ClassVar[ConfigDict] = {
+# Built-in defaults, built once at import and shared by every Config instance. The
+# template is read-only so no caller can corrupt it through a stray reference; each
+# Config works on its own mutable copy (see _thaw).
+_DEFAULT_CONFIG = _freeze(
+    {
         "defaults": {
             "output_dir": "~/processed",
             "preserve_structure": True,
@@ -96,6 +128,36 @@ class Config:
             },
         },
     }
+)
+
+
+class _DefaultConfigCopy:
+    """Class attribute that hands out a fresh, mutable copy of the built-in defaults."""
+
+    def __get__(self, instance: object, owner: type | None = None) -> ConfigDict:
+        return _thaw(_DEFAULT_CONFIG)
+
+
+class Config:
+    """
+    Manages topyaz configuration from files and environment.
+
+    Configuration is loaded from:
+    1. Default values (hardcoded)
+    2. System _config file (~/.topyaz/_config.yaml)
+    3. User-specified _config file
+    4. Environment variables (TOPYAZ_* prefix)
+
+    Configuration keys can be accessed using dot notation:
+        _config.get("video.default_model")
+        _config.get("defaults.output_dir", "~/processed")
+
+    Used in:
+    - topyaz/cli.py
+    - topyaz/core/__init__.py
+    """
+
+    DEFAULT_CONFIG = _DefaultConfigCopy()
 
     def __init__(self, config_file: Path | None = None):
         """
@@ -118,41 +180,90 @@ class Config:
             Merged configuration dictionary
 
         """
-        # Start with default _config
-        config = self._deep_copy_dict(self.DEFAULT_CONFIG)
-
-        # Load from _config file if it exists
-        if self.config_file.exists():
-            try:
-                with open(self.config_file) as f:
-                    user_config_loaded = yaml.safe_load(f)
-
-                if not isinstance(user_config_loaded, dict):
-                    logger.warning(
-                        f"Config file {self.config_file} did not parse into a dictionary "
-                        f"(got {type(user_config_loaded)}). Using default configuration."
-                    )
-                    user_config = {}
-                else:
-                    user_config = user_config_loaded
-
-                if user_config:  # Only merge if user_config is a non-empty dict
-                    config = self._merge_configs(config, user_config)
-                    logger.debug(f"Loaded configuration from {self.config_file}")
-                elif user_config_loaded is None:  # Empty file, parsed as None
-                    logger.debug(f"Config file {self.config_file} is empty. Using defaults.")
-                # If user_config_loaded was not a dict and not None, warning already logged.
-
-            except yaml.YAMLError as e:
-                logger.warning(f"Failed to parse YAML from _config file {self.config_file}: {e}. Using defaults.")
-                # config remains default here
-            except Exception as e:
-                logger.warning(f"Failed to load _config from {self.config_file}: {e}. Using defaults.")
-                # config remains default here
-        else:
+        if not self.config_file.exists():
             logger.debug(f"Config file not found: {self.config_file}")
+            return self._deep_copy_dict(_DEFAULT_CONFIG)
+
+        try:
+            return self._read_config_file()
+        except Exception as e:
+            logger.warning(f"Failed to load _config from {self.config_file}: {e}. Using defaults.")
+        return self._deep_copy_dict(_DEFAULT_CONFIG)
+
+    def _load_from_stream(self, stream: IO[Any], source: object = "<stream>") -> ConfigDict:
+        """
+        Build a configuration from the defaults and an open YAML stream.
+
+        The config file is loaded through here (see ``_read_config_file``), and
+        tests can pass in-memory streams. Unparsable YAML falls back to the defaults.
 
-        return config
+        Args:
+            stream: Text or binary stream of YAML
+            source: Where the YAML came from, for log messages
+
+        Returns:
+            Defaults merged with the stream's settings
+
+        """
+        config = self._deep_copy_dict(_DEFAULT_CONFIG)
+        try:
+            user_config_loaded = yaml.load(stream, Loader=_YAML_LOADER)  # noqa: S506 - safe loader
+        except yaml.YAMLError as e:
+            logger.warning(f"Failed to parse YAML from {source}: {e}. Using defaults.")
+            return config
+        return self._merge_user_config(config, user_config_loaded, source)
+
+    def _merge_user_config(self, config: ConfigDict, user_config_loaded: Any, source: object) -> ConfigDict:
+        """
+        Merge parsed user YAML over the defaults.
+
+        Args:
+            config: Default configuration (not modified)
+            user_config_loaded: Parsed YAML content
+            source: Where the YAML came from, for log messages
+
+        Returns:
+            Merged configuration, or ``config`` if there is nothing to merge
+
+        """
+        if user_config_loaded is None:  # Empty file, parsed as None
+            logger.debug(f"Config file {source} is empty. Using defaults.")
+            return config
+
+        if not isinstance(user_config_loaded, dict):
+            logger.warning(
+                f"Config file {source} did not parse into a dictionary "
+                f"(got {type(user_config_loaded)}). Using default configuration."
+            )
+            return config
+
+        if not user_config_loaded:
+            return config
+
+        logger.debug(f"Loaded configuration from {source}")
+        return self._merge_configs(config, user_config_loaded)
+
+    def _read_config_file(self) -> ConfigDict:
+        """
+        Load the config file, reusing the cached result when the file is unchanged.
+
+        Returns:
+            Merged configuration (a private copy safe for the caller to mutate)
+
+        """
+        stat = self.config_file.stat()
+        cache_key = (str(self.config_file.resolve()), stat.st_mtime_ns, stat.st_size)
+
+        if cache_key not in _CONFIG_CACHE:
+            # Binary mode lets LibYAML consume the buffer without a Python-level decode pass
+            with open(self.config_file, "rb") as f:
+                config = self._load_from_stream(f, self.config_file)
+            _CONFIG_CACHE[cache_key] = pickle.dumps(config, protocol=pickle.HIGHEST_PROTOCOL)
+        else:
+            logger.debug(f"Using cached parse of {self.config_file}")
+
+        config_copy: ConfigDict = pickle.loads(_CONFIG_CACHE[cache_key])  # noqa: S301 - bytes pickled above, in-process
+        return config_copy
 
     def _load_env_vars(self) -> None:
         """
@@ -164,17 +275,14 @@ class Config:
             TOPYAZ_DEFAULTS__LOG_LEVEL=DEBUG
 
         """
-        prefix = "TOPYAZ_"
+        prefix_len = len(ENV_PREFIX)
 
         for key, value in os.environ.items():
-            if not key.startswith(prefix):
+            if not key.startswith(ENV_PREFIX):
                 continue
 
-            # Remove prefix and convert to lowercase
-            config_key = key[len(prefix) :].lower()
-
-            # Convert double underscores to dots for nested keys
-            config_key = config_key.replace("__", ".")
+            # Strip the prefix, lowercase, and turn double underscores into nested-key dots
+            config_key = key[prefix_len:].lower().replace("__", ".")
 
             # Try to parse value as appropriate type
             parsed_value = self._parse_env_value(value)
@@ -195,10 +303,9 @@ class Config:
 
         """
         # Try to parse as boolean
-        if value.lower() in ("true", "yes", "1", "on"):
-            return True
-        if value.lower() in ("false", "no", "0", "off"):
-            return False
+        boolean = _ENV_BOOLEANS.get(value.lower())
+        if boolean is not None:
+            return boolean
 
         # Try to parse as integer
         try:
@@ -244,18 +351,21 @@ class Config:
                 )
         return result
 
-    def _deep_copy_dict(self, d: ConfigDict) -> ConfigDict:
+    def _deep_copy_dict(self, d: Mapping[str, Any]) -> ConfigDict:
         """
-        Create a deep copy of a dictionary.
+        Create a deep, mutable copy of a (possibly read-only) configuration mapping.
+
+        Nested mappings become dicts and lists (e.g. executable paths) are copied
+        so that edits never leak back into the shared default template.
 
         Args:
-            d: Dictionary to copy
+            d: Mapping to copy
 
         Returns:
-            Deep copy of the dictionary
+            Deep copy of the mapping as plain dicts
 
         """
-        return {key: self._deep_copy_dict(value) if isinstance(value, dict) else value for key, value in d.items()}
+        return _thaw(d)
 
     def get(self, key: str, default: Any = None) -> Any:
         """
@@ -331,7 +441,7 @@ class Config:
 
         try:
             with open(save_path, "w") as f:
-                yaml.safe_dump(self.config, f, default_flow_style=False, sort_keys=False)
+                yaml.dump(self.config, f, Dumper=_YAML_DUMPER, default_flow_style=False, sort_keys=False)
             logger.info(f"Saved configuration to {save_path}")
         except Exception as e:
             logger.error(f"Failed to save configuration: {e}")
@@ -187,6 +187,31 @@ class PhotoAIParams:
     color: bool | None = None
 
 
+@dataclass(frozen=True)
+class ParamSpec:
+    """
+    Validation rule for a single product parameter.
+
+    A spec either bounds a numeric value (``bounds``) or restricts it to a set
+    of ``choices``. String choices are matched case-insensitively and reported
+    as "Invalid <label> '<value>'. Valid <noun>: ..."; other choices are
+    listed inline ("<label> must be 8 or 16"). A missing or ``None`` value is
+    checked as ``default``; parameters without a default are then skipped.
+
+    Used in:
+    - topyaz/products/base.py
+    - topyaz/products/gigapixel/api.py
+    - topyaz/products/photo_ai/params.py
+    - topyaz/products/video_ai/params.py
+    """
+
+    label: str
+    default: Any = None
+    bounds: tuple[int, int] | None = None
+    choices: frozenset[Any] | None = None
+    noun: str = "values"
+
+
 @dataclass
 class GPUInfo:
     """Information about a GPU device.
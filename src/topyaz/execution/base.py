@@ -127,7 +127,6 @@ class ExecutorContext:
         Used in:
         - topyaz/execution/local.py
         """
-        # import os # Moved to top
         env = os.environ.copy()
         env.update(self.env_vars)
         return env
@@ -8,6 +8,7 @@ handling and error recovery.
 
 """
 
+import shlex
 import subprocess
 import time
 from typing import Any
@@ -68,13 +69,17 @@ class LocalExecutor(CommandExecutor):
         actual_timeout = timeout or self.context.timeout
 
         if self.context.dry_run:
-            logger.info(f"DRY RUN: {' '.join(command)}")
+            logger.info(f"DRY RUN: {shlex.join(command)}")
             return 0, "dry-run-output", ""
 
         try:
-            logger.debug(f"Executing locally: {' '.join(command)}")
+            # Lazy: the quoted command is only built when DEBUG output is enabled
+            logger.opt(lazy=True).debug("Executing locally: {}", lambda: shlex.join(command))
 
-            # Prepare subprocess arguments
+            # Prepare subprocess arguments. capture_output routes through
+            # Popen.communicate(), which on POSIX drains stdout and stderr together
+            # with a selector and bulk os.read() calls and decodes each stream once
+            # at the end - no per-line reader threads are needed here.
             kwargs: dict[str, Any] = {
                 "input": input_data,
                 "capture_output": True,
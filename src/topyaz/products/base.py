@@ -13,13 +13,17 @@ Used in:
 - topyaz/products/_video_ai.py
 """
 
-import platform
+import functools
+import os
 import re  # Moved from _parse_version
+import shlex
 import shutil
+import stat
 import subprocess  # Moved from validate_macos_version
 import tempfile  # Moved from process
 import time  # Moved from process
 from abc import ABC, abstractmethod
+from collections.abc import Mapping
 from pathlib import Path
 from typing import Any
 
@@ -28,13 +32,104 @@ from loguru import logger
 from topyaz.core.errors import ExecutableNotFoundError, ValidationError
 from topyaz.core.types import (
     CommandList,
+    ParamSpec,
     ProcessingOptions,
     ProcessingResult,
     Product,
 )
 from topyaz.execution.base import CommandExecutor
+from topyaz.system.host import PLATFORM_SYSTEM
 from topyaz.system.paths import PathValidator
 
+# Executables resolved by find_executable, shared across product instances so that
+# every TopyazCLI (and every lazily created product) pays the search-path stat()
+# probes and the PATH scan at most once per process. Misses are not cached, so an
+# app installed mid-session is still picked up; hits are re-checked with a single
+# access() so an app removed mid-session is searched for again.
+_EXECUTABLE_CACHE: dict[Product, Path] = {}
+
+
+def clear_executable_cache() -> None:
+    """
+    Forget all executables resolved by ``TopazProduct.find_executable``.
+
+    Used in:
+    - tests/products/gigapixel/test_api.py
+    """
+    _EXECUTABLE_CACHE.clear()
+
+
+def validate_param_schema(schema: Mapping[str, ParamSpec], params: Mapping[str, Any]) -> None:
+    """
+    Validate parameters against a product's module-level schema.
+
+    Specs are checked in schema order and the first violation is raised, so the
+    schema order is the order users see errors in.
+
+    Args:
+        schema: Parameter name to validation rule
+        params: Parameters as passed to ``validate_params``
+
+    Raises:
+        ValidationError: On the first parameter that violates its spec
+
+    Used in:
+    - topyaz/products/gigapixel/api.py
+    - topyaz/products/photo_ai/params.py
+    - topyaz/products/video_ai/params.py
+    """
+    for name, spec in schema.items():
+        value = params.get(name)
+        if value is None:
+            # An explicit None stands for the default, which is what the product will use
+            value = spec.default
+            if value is None:
+                continue
+
+        if spec.bounds is not None:
+            low, high = spec.bounds
+            if not (low <= value <= high):
+                msg = f"{spec.label} must be between {low} and {high}, got {value}"
+                raise ValidationError(msg)
+
+        elif spec.choices is not None:
+            candidate = value.lower() if isinstance(value, str) else value
+            if candidate not in spec.choices:
+                raise ValidationError(_describe_invalid_choice(spec, value))
+
+
+def _describe_invalid_choice(spec: ParamSpec, value: Any) -> str:
+    """Build the error message for a value outside ``spec.choices`` (error path only)."""
+    allowed, is_vocabulary = _format_choices(spec.choices or frozenset())
+    if is_vocabulary:
+        return f"Invalid {spec.label} '{value}'. Valid {spec.noun}: {allowed}"
+    return f"{spec.label} must be {allowed}, got {value}"
+
+
+@functools.lru_cache(maxsize=32)
+def _format_choices(choices: frozenset[Any]) -> tuple[str, bool]:
+    """
+    Render a choice set for error messages, once per distinct set.
+
+    Returns:
+        (text, is_vocabulary): "a, b, c" for string vocabularies, otherwise an
+        inline list such as "8", "8 or 16" or "0, 8, or 16"
+
+    """
+    try:
+        ordered = sorted(choices)
+    except TypeError:
+        # Mixed types (e.g. None alongside ints) have no natural order
+        ordered = sorted(choices, key=str)
+    if all(isinstance(choice, str) for choice in ordered):
+        return ", ".join(ordered), True
+    *head, last = (str(choice) for choice in ordered)
+    if not head:
+        return last, False
+    if len(head) == 1:
+        return f"{head[0]} or {last}", False
+    return f"{', '.join(head)}, or {last}", False
+
 
 class TopazProduct(ABC):
     """
@@ -67,6 +162,7 @@ class TopazProduct(ABC):
         self.path_validator = PathValidator()
         self._executable_path: Path | None = None
         self._version: str | None = None
+        self._last_valid_params: dict[str, tuple[type, Any]] | None = None
 
     @property
     @abstractmethod
@@ -110,6 +206,28 @@ class TopazProduct(ABC):
         """
         pass
 
+    def validate_params_once(self, **kwargs: Any) -> None:
+        """
+        Validate parameters, skipping the check when they match the last valid set.
+
+        Batch runs call ``process`` per file with the same parameters; validation
+        is a pure function of them, so only a change needs re-checking. Only
+        successful validations are remembered. Values are compared together with
+        their types, since ``True == 1`` and ``1 == 1.0`` yet validate differently.
+
+        Args:
+            **kwargs: Product-specific parameters
+
+        Raises:
+            ValidationError: If parameters are invalid
+
+        """
+        params_key = {name: (type(value), value) for name, value in kwargs.items()}
+        if params_key == self._last_valid_params:
+            return
+        self.validate_params(**kwargs)
+        self._last_valid_params = params_key
+
     @abstractmethod
     def build_command(self, input_path: Path, output_path: Path, **kwargs: Any) -> CommandList:
         """
@@ -165,16 +283,27 @@ class TopazProduct(ABC):
             Path to executable if found, None otherwise
 
         """
-        if self._executable_path and self._executable_path.exists():
+        # Both the instance and the shared cache are confirmed with one access(), so
+        # an executable removed or upgraded away mid-session is searched for again
+        if self._executable_path and os.access(self._executable_path, os.X_OK):
             return self._executable_path
 
+        cached_path = _EXECUTABLE_CACHE.get(self.product_type)
+        if cached_path:
+            if os.access(cached_path, os.X_OK):
+                self._executable_path = cached_path
+                return cached_path
+            del _EXECUTABLE_CACHE[self.product_type]
+
         # Search in standard locations
         search_paths = self.get_search_paths()
 
+        # One access() per candidate: it checks existence and the execute bit
+        # together, so a stray non-executable file is not picked up.
         for search_path in search_paths:
-            if search_path.exists():
+            if os.access(search_path, os.X_OK):
                 logger.debug(f"Found {self.product_name} at: {search_path}")
-                self._executable_path = search_path
+                self._executable_path = _EXECUTABLE_CACHE[self.product_type] = search_path
                 return search_path
 
         # Try system PATH as fallback
@@ -182,7 +311,7 @@ class TopazProduct(ABC):
         if system_executable:
             path = Path(system_executable)
             logger.debug(f"Found {self.product_name} in PATH: {path}")
-            self._executable_path = path
+            self._executable_path = _EXECUTABLE_CACHE[self.product_type] = path
             return path
 
         logger.warning(f"{self.product_name} executable not found")
@@ -252,7 +381,6 @@ class TopazProduct(ABC):
         lines = version_output.strip().split("\n")
         if lines:
             # Look for version numbers in first few lines
-            # import re # Moved to top
 
             version_pattern = re.compile(r"(\d+\.\d+(?:\.\d+)*)")
             for line in lines[:3]:
@@ -308,6 +436,26 @@ class TopazProduct(ABC):
         """Get suffix to add to output filenames."""
         return f"_{self.product_type.value.lower()}"
 
+    def _file_size(self, path: Path) -> int:
+        """
+        Get the size of a regular file with a single stat() call.
+
+        Args:
+            path: File to measure
+
+        Returns:
+            Size in bytes, or 0 if the path is missing or not a regular file
+
+        Used in:
+        - topyaz/products/base.py
+        - topyaz/products/video_ai/api.py
+        """
+        try:
+            st = path.stat()
+        except OSError:
+            return 0
+        return st.st_size if stat.S_ISREG(st.st_mode) else 0
+
     def process(self, input_path: Path | str, output_path: Path | str | None = None, **kwargs: Any) -> ProcessingResult:
         """
         Template method for processing files. Uses temporary directory workflow.
@@ -335,7 +483,7 @@ class TopazProduct(ABC):
 
         # Validate inputs
         self.validate_input_path(input_path)
-        self.validate_params(**kwargs)
+        self.validate_params_once(**kwargs)
 
         # Determine final output path
         if output_path:
@@ -352,7 +500,6 @@ class TopazProduct(ABC):
         self.get_executable_path()
 
         # Create temporary directory for processing
-        # import tempfile # Moved to top
 
         with tempfile.TemporaryDirectory(prefix=f"topyaz_{self.product_type.value}_") as temp_dir:
             temp_output_dir = Path(temp_dir)
@@ -364,7 +511,7 @@ class TopazProduct(ABC):
                 logger.info(f"Processing {input_path} with {self.product_name}")
 
                 if self.options.dry_run:
-                    logger.info(f"DRY RUN: Would execute: {' '.join(command)}")
+                    logger.info(f"DRY RUN: Would execute: {shlex.join(command)}")
                     return ProcessingResult(
                         success=True,
                         input_path=input_path,
@@ -377,9 +524,8 @@ class TopazProduct(ABC):
                         file_size_after=0,
                     )
 
-                # import time # Moved to top
                 start_time = time.time()
-                file_size_before = input_path.stat().st_size if input_path.is_file() else 0
+                file_size_before = self._file_size(input_path)
 
                 # Execute the command
                 exit_code, stdout, stderr = self.executor.execute(command, timeout=self.options.timeout)
@@ -422,7 +568,7 @@ class TopazProduct(ABC):
                 shutil.move(str(temp_output_file), str(final_output_path))
 
                 # Get file size after processing
-                file_size_after = final_output_path.stat().st_size if final_output_path.exists() else 0
+                file_size_after = self._file_size(final_output_path)
 
                 # Parse output for additional information
                 parsed_info = self.parse_output(stdout, stderr)
@@ -478,7 +624,7 @@ class TopazProduct(ABC):
             "executable_found": executable is not None,
             "version": version,
             "supported_formats": self.supported_formats,
-            "platform": platform.system(),
+            "platform": PLATFORM_SYSTEM,
         }
 
 
@@ -530,13 +676,12 @@ class MacOSTopazProduct(TopazProduct):
             ValidationError: If macOS version is incompatible
 
         """
-        if platform.system() != "Darwin":
+        if PLATFORM_SYSTEM != "Darwin":
             msg = f"{self.product_name} is only available on macOS"
             raise ValidationError(msg)
 
         # Check minimum macOS version (most Topaz products require 10.15+)
         try:
-            # import subprocess # Moved to top
             # S607: Use full path for sw_vers
             result = subprocess.run(["/usr/bin/sw_vers", "-productVersion"], capture_output=True, text=True, check=True)
             version_str = result.stdout.strip()
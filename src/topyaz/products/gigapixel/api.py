@@ -9,15 +9,17 @@ for upscaling, denoising, and enhancement of images.
 """
 
 import contextlib
-import platform
+from collections.abc import Mapping
 from pathlib import Path
+from types import MappingProxyType
 from typing import Any
 
 # from loguru import logger # F401: Unused import
-from topyaz.core.errors import ProcessingError, ValidationError
-from topyaz.core.types import CommandList, GigapixelParams, ProcessingOptions, Product
+from topyaz.core.errors import ProcessingError
+from topyaz.core.types import CommandList, GigapixelParams, ParamSpec, ProcessingOptions, Product
 from topyaz.execution.base import CommandExecutor
-from topyaz.products.base import MacOSTopazProduct
+from topyaz.products.base import MacOSTopazProduct, validate_param_schema
+from topyaz.system.host import PLATFORM_SYSTEM
 
 # Constants for Gigapixel AI parameter validation
 GIGA_MAX_SCALE = 6
@@ -25,6 +27,56 @@ GIGA_MAX_EFFECT_STRENGTH = 100  # For denoise, sharpen, etc.
 GIGA_MAX_CREATIVITY_TEXTURE = 6
 GIGA_MAX_QUALITY = 100
 GIGA_MAX_PARALLEL_READ = 10
+GIGA_VALID_MODELS = frozenset(
+    {
+        "std",
+        "standard",
+        "hf",
+        "high fidelity",
+        "fidelity",
+        "low",
+        "lowres",
+        "low resolution",
+        "low res",
+        "art",
+        "cg",
+        "cgi",
+        "lines",
+        "compression",
+        "very compressed",
+        "high compression",
+        "vc",
+        "text",
+        "txt",
+        "text refine",
+        "recovery",
+        "redefine",
+    }
+)
+GIGA_VALID_FORMATS = frozenset({"preserve", "jpg", "jpeg", "png", "tif", "tiff"})
+GIGA_VALID_BIT_DEPTHS = frozenset({0, 8, 16})
+GIGA_VALID_FACE_RECOVERY_VERSIONS = frozenset({1, 2})
+# Checked in this order by validate_params; the first violation is reported
+GIGA_PARAM_SCHEMA: Mapping[str, ParamSpec] = MappingProxyType(
+    {
+        "model": ParamSpec("model", default="std", choices=GIGA_VALID_MODELS, noun="models"),
+        "scale": ParamSpec("Scale", default=2, bounds=(1, GIGA_MAX_SCALE)),
+        "denoise": ParamSpec("denoise", bounds=(1, GIGA_MAX_EFFECT_STRENGTH)),
+        "sharpen": ParamSpec("sharpen", bounds=(1, GIGA_MAX_EFFECT_STRENGTH)),
+        "compression": ParamSpec("compression", bounds=(1, GIGA_MAX_EFFECT_STRENGTH)),
+        "detail": ParamSpec("detail", bounds=(1, GIGA_MAX_EFFECT_STRENGTH)),
+        "face_recovery": ParamSpec("face_recovery", bounds=(1, GIGA_MAX_EFFECT_STRENGTH)),
+        "creativity": ParamSpec("creativity", bounds=(1, GIGA_MAX_CREATIVITY_TEXTURE)),
+        "texture": ParamSpec("texture", bounds=(1, GIGA_MAX_CREATIVITY_TEXTURE)),
+        "face_recovery_version": ParamSpec(
+            "Face recovery version", default=2, choices=GIGA_VALID_FACE_RECOVERY_VERSIONS
+        ),
+        "format_output": ParamSpec("format_output", default="preserve", choices=GIGA_VALID_FORMATS, noun="formats"),
+        "quality_output": ParamSpec("Quality", default=95, bounds=(1, GIGA_MAX_QUALITY)),
+        "bit_depth": ParamSpec("Bit depth", default=0, choices=GIGA_VALID_BIT_DEPTHS),
+        "parallel_read": ParamSpec("Parallel read", default=1, bounds=(1, GIGA_MAX_PARALLEL_READ)),
+    }
+)
 
 
 class GigapixelAI(MacOSTopazProduct):
@@ -78,14 +130,14 @@ class GigapixelAI(MacOSTopazProduct):
 
     def get_search_paths(self) -> list[Path]:
         """Get platform-specific search paths for Gigapixel AI."""
-        if platform.system() == "Darwin":
+        if PLATFORM_SYSTEM == "Darwin":
             # macOS paths
             return [
                 Path("/Applications/Topaz Gigapixel AI.app/Contents/Resources/bin/gigapixel"),
                 Path("/Applications/Topaz Gigapixel AI.app/Contents/MacOS/Topaz Gigapixel AI"),
                 Path.home() / "Applications/Topaz Gigapixel AI.app/Contents/Resources/bin/gigapixel",
             ]
-        if platform.system() == "Windows":
+        if PLATFORM_SYSTEM == "Windows":
             # Windows paths
             return [
                 Path("C:/Program Files/Topaz Labs LLC/Topaz Gigapixel AI/bin/_gigapixel.exe"),
@@ -105,101 +157,7 @@ class GigapixelAI(MacOSTopazProduct):
             ValidationError: If parameters are invalid
 
         """
-        # Extract Gigapixel-specific parameters
-        model = kwargs.get("model", "std")
-        scale = kwargs.get("scale", 2)
-        denoise = kwargs.get("denoise")
-        sharpen = kwargs.get("sharpen")
-        compression = kwargs.get("compression")
-        detail = kwargs.get("detail")
-        creativity = kwargs.get("creativity")
-        texture = kwargs.get("texture")
-        face_recovery = kwargs.get("face_recovery")
-        face_recovery_version = kwargs.get("face_recovery_version", 2)
-        format_param = kwargs.get("format_output", "preserve")
-        quality = kwargs.get("quality_output", 95)
-        bit_depth = kwargs.get("bit_depth", 0)
-        parallel_read = kwargs.get("parallel_read", 1)
-
-        # Validate model
-        valid_models = {
-            "std",
-            "standard",
-            "hf",
-            "high fidelity",
-            "fidelity",
-            "low",
-            "lowres",
-            "low resolution",
-            "low res",
-            "art",
-            "cg",
-            "cgi",
-            "lines",
-            "compression",
-            "very compressed",
-            "high compression",
-            "vc",
-            "text",
-            "txt",
-            "text refine",
-            "recovery",
-            "redefine",
-        }
-        if model.lower() not in valid_models:
-            msg = f"Invalid model '{model}'. Valid models: {', '.join(sorted(valid_models))}"
-            raise ValidationError(msg)
-
-        # Validate scale
-        if not (1 <= scale <= GIGA_MAX_SCALE):
-            msg = f"Scale must be between 1 and {GIGA_MAX_SCALE}, got {scale}"
-            raise ValidationError(msg)
-
-        # Validate optional numeric parameters
-        numeric_params = {
-            "denoise": denoise,
-            "sharpen": sharpen,
-            "compression": compression,
-            "detail": detail,
-            "face_recovery": face_recovery,
-        }
-
-        for param_name, value in numeric_params.items():
-            if value is not None and not (1 <= value <= GIGA_MAX_EFFECT_STRENGTH):
-                msg = f"{param_name} must be between 1 and {GIGA_MAX_EFFECT_STRENGTH}, got {value}"
-                raise ValidationError(msg)
-
-        # Validate creativity and texture (special range)
-        for param_name, value in [("creativity", creativity), ("texture", texture)]:
-            if value is not None and not (1 <= value <= GIGA_MAX_CREATIVITY_TEXTURE):
-                msg = f"{param_name} must be between 1 and {GIGA_MAX_CREATIVITY_TEXTURE}, got {value}"
-                raise ValidationError(msg)
-
-        # Validate face recovery version
-        if face_recovery_version not in [1, 2]:
-            msg = f"Face recovery version must be 1 or 2, got {face_recovery_version}"
-            raise ValidationError(msg)
-
-        # Validate output format_output
-        valid_formats = {"preserve", "jpg", "jpeg", "png", "tif", "tiff"}
-        if format_param.lower() not in valid_formats:
-            msg = f"Invalid format_output '{format_param}'. Valid formats: {', '.join(sorted(valid_formats))}"
-            raise ValidationError(msg)
-
-        # Validate quality_output
-        if not (1 <= quality <= GIGA_MAX_QUALITY):
-            msg = f"Quality must be between 1 and {GIGA_MAX_QUALITY}, got {quality}"
-            raise ValidationError(msg)
-
-        # Validate bit depth
-        if bit_depth not in [0, 8, 16]:
-            msg = f"Bit depth must be 0, 8, or 16, got {bit_depth}"
-            raise ValidationError(msg)
-
-        # Validate parallel read
-        if not (1 <= parallel_read <= GIGA_MAX_PARALLEL_READ):
-            msg = f"Parallel read must be between 1 and {GIGA_MAX_PARALLEL_READ}, got {parallel_read}"
-            raise ValidationError(msg)
+        validate_param_schema(GIGA_PARAM_SCHEMA, kwargs)
 
     def build_command(self, input_path: Path, output_path: Path, **kwargs: Any) -> CommandList:
         """
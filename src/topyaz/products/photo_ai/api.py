@@ -8,7 +8,6 @@ for automatic and manual photo enhancement.
 """
 
 import contextlib
-import platform
 from pathlib import Path
 from typing import Any
 
@@ -23,6 +22,7 @@ from topyaz.products.base import MacOSTopazProduct
 from topyaz.products.photo_ai.batch import PhotoAIBatch
 from topyaz.products.photo_ai.params import PhotoAIParams  # Kept this direct import
 from topyaz.products.photo_ai.preferences import PhotoAIAutopilotSettings, PhotoAIPreferences
+from topyaz.system.host import PLATFORM_SYSTEM
 
 
 class PhotoAI(MacOSTopazProduct):
@@ -56,13 +56,13 @@ class PhotoAI(MacOSTopazProduct):
         return ["jpg", "jpeg", "png", "tiff", "tif", "bmp", "webp", "dng", "raw", "cr2", "nef", "arw", "orf", "rw2"]
 
     def get_search_paths(self) -> list[Path]:
-        if platform.system() == "Darwin":
+        if PLATFORM_SYSTEM == "Darwin":
             return [
                 Path("/Applications/Topaz Photo AI.app/Contents/Resources/bin/tpai"),
                 Path("/Applications/Topaz Photo AI.app/Contents/MacOS/Topaz Photo AI"),
                 Path.home() / "Applications/Topaz Photo AI.app/Contents/Resources/bin/tpai",
             ]
-        if platform.system() == "Windows":
+        if PLATFORM_SYSTEM == "Windows":
             return [
                 Path("C:/Program Files/Topaz Labs LLC/Topaz Photo AI/tpai.exe"),
                 Path("C:/Program Files (x86)/Topaz Labs LLC/Topaz Photo AI/tpai.exe"),
@@ -1,3 +1,4 @@
+import os
 import shutil
 import tempfile
 from pathlib import Path
@@ -6,7 +7,9 @@ from typing import Any
 from loguru import logger
 
 from topyaz.core.errors import ProcessingError
+from topyaz.core.types import CommandList
 from topyaz.products.base import TopazProduct
+from topyaz.products.photo_ai.params import PHOTOAI_CLI_INPUT_INDEX
 
 # Exit codes for Photo AI CLI
 PHOTOAI_EXIT_CODE_NO_VALID_FILES = 255
@@ -22,6 +25,8 @@ class PhotoAIBatch:
         self.product = product_instance
         self.executor = product_instance.executor
         self.options = product_instance.options
+        # Lower-case extensions without the dot, matched against name.rpartition(".")
+        self._extensions = frozenset(ext.lower() for ext in product_instance.supported_formats)
 
     def process_batch_directory(self, input_dir: Path, output_dir: Path, **kwargs: Any) -> list[dict[str, Any]]:
         """
@@ -36,11 +41,21 @@ class PhotoAIBatch:
         batches = [image_files[i : i + self.MAX_BATCH_SIZE] for i in range(0, len(image_files), self.MAX_BATCH_SIZE)]
         logger.info(f"Processing {len(batches)} batch(es) of up to {self.MAX_BATCH_SIZE} images each")
 
+        # Build the command once; each batch only swaps in its staging directory
+        base_cmd = self.product.build_command(input_dir, output_dir, **kwargs)
+
+        if len(batches) == 1 and self._can_run_in_place(input_dir, output_dir, image_files):
+            # Everything fits in one Photo AI run: no staging directory or symlinks needed
+            result = self._run_batch_command(base_cmd, 1, len(image_files))
+            if not result["success"]:
+                logger.error("Batch 1 failed")
+            return [result]
+
         results: list[dict[str, Any]] = []
         for batch_num, batch_files in enumerate(batches, 1):
             logger.info(f"Processing batch {batch_num}/{len(batches)} ({len(batch_files)} images)")
             try:
-                result = self._process_single_batch(batch_files, output_dir, batch_num, **kwargs)
+                result = self._process_single_batch(batch_files, output_dir, batch_num, base_cmd=base_cmd, **kwargs)
                 results.append(result)
                 if not result.get("success", False):
                     logger.error(f"Batch {batch_num} failed")
@@ -53,49 +68,128 @@ class PhotoAIBatch:
                 break
         return results
 
+    def _can_run_in_place(self, input_dir: Path, output_dir: Path, image_files: list[Path]) -> bool:
+        """
+        Check whether Photo AI can be pointed at ``input_dir`` without staging.
+
+        Photo AI reads the directory itself, so this is only safe when the
+        directory holds exactly ``image_files`` (no subdirectories and no other
+        files) and ``output_dir`` does not lie inside it.
+        """
+        input_root = input_dir.absolute()
+        if output_dir.resolve().is_relative_to(input_dir.resolve()):
+            return False
+        if any(file_path.parent != input_root for file_path in image_files):
+            return False
+        try:
+            with os.scandir(input_root) as entries:
+                return sum(1 for _ in entries) == len(image_files)
+        except OSError as e:
+            logger.debug(f"Could not list {input_root}, staging instead: {e}")
+            return False
+
     def _find_image_files(self, input_dir: Path) -> list[Path]:
+        """
+        Collect supported images under ``input_dir`` in one recursive pass.
+
+        Extensions match case-insensitively. Directory symlinks are not followed,
+        as with ``Path.rglob``; ``DirEntry`` type checks reuse the scan's cached
+        file type instead of issuing a ``stat()`` per entry. Paths are absolute
+        (the root is made absolute once, without a per-file ``resolve()``) so
+        they can be symlinked into the staging directory as-is.
+        """
+        extensions = self._extensions
         image_files: list[Path] = []
-        for ext in self.product.supported_formats:
-            image_files.extend(input_dir.rglob(f"*.{ext}"))
-            image_files.extend(input_dir.rglob(f"*.{ext.upper()}"))
-        return list(set(image_files))
+        pending = [str(input_dir.absolute())]
+        while pending:
+            directory = pending.pop()
+            # An unreadable subdirectory is skipped, as rglob does, rather than failing the batch
+            try:
+                with os.scandir(directory) as entries:
+                    for entry in entries:
+                        if entry.is_dir(follow_symlinks=False):
+                            pending.append(entry.path)
+                            continue
+                        _, dot, ext = entry.name.rpartition(".")
+                        if dot and ext.lower() in extensions and entry.is_file():
+                            image_files.append(Path(entry.path))
+            except OSError as e:
+                logger.warning(f"Skipping unreadable directory {directory}: {e}")
+        image_files.sort()
+        return image_files
 
     def _process_single_batch(
-        self, batch_files: list[Path], output_dir: Path, batch_num: int, **kwargs: Any
+        self,
+        batch_files: list[Path],
+        output_dir: Path,
+        batch_num: int,
+        *,
+        base_cmd: CommandList | None = None,
+        **kwargs: Any,
     ) -> dict[str, Any]:
         with tempfile.TemporaryDirectory(prefix=f"topyaz_batch_{batch_num}_") as temp_dir:
             temp_path = Path(temp_dir)
             batch_input_dir = temp_path / "input"
             batch_input_dir.mkdir()
 
+            # Files from different subdirectories can share a name; number repeats
+            # in memory rather than probing the fresh staging dir for each file.
+            # Names are compared casefolded because the staging dir may live on a
+            # case-insensitive filesystem (APFS, NTFS) where IMG.jpg is img.jpg.
+            # Sources are already absolute, so each file costs one symlink() and
+            # no resolve(); stem/suffix are only computed on a name collision.
+            seen_names: dict[str, int] = {}
             for file_path in batch_files:
-                target_path = batch_input_dir / file_path.name
+                name = file_path.name
+                count = seen_names.get(name.casefold(), 0)
+                seen_names[name.casefold()] = count + 1
+                while count:
+                    candidate = f"{file_path.stem}_{count}{file_path.suffix}"
+                    if candidate.casefold() not in seen_names:
+                        name = candidate
+                        seen_names[name.casefold()] = 1
+                        break
+                    count += 1
+                target_path = batch_input_dir / name
                 try:
                     target_path.symlink_to(file_path)
+                except FileExistsError:
+                    raise
                 except OSError:
-                    shutil.copy2(file_path, target_path)
+                    # Symlinks unsupported here: copy instead, with exclusive create
+                    # so an existing staged entry is never written through
+                    with file_path.open("rb") as source, target_path.open("xb") as target:
+                        shutil.copyfileobj(source, target)
+                    shutil.copystat(file_path, target_path)
 
-            cmd = self.product.build_command(batch_input_dir, output_dir, **kwargs)
-            try:
-                exit_code, stdout, stderr = self.executor.execute(cmd, timeout=self.options.timeout)
-                # stdout removed from call to _handle_photo_ai_result
-                success = self._handle_photo_ai_result(exit_code, stderr, batch_num)
-                return {
-                    "batch_num": batch_num,
-                    "success": success,
-                    "exit_code": exit_code,
-                    "files_count": len(batch_files),
-                    "stdout": stdout,
-                    "stderr": stderr,
-                }
-            except Exception as e:
-                logger.error(f"Batch {batch_num} execution failed: {e}")
-                return {
-                    "batch_num": batch_num,
-                    "success": False,
-                    "error": str(e),
-                    "files_count": len(batch_files),
-                }
+            if base_cmd is None:
+                cmd = self.product.build_command(batch_input_dir, output_dir, **kwargs)
+            else:
+                cmd = list(base_cmd)
+                cmd[PHOTOAI_CLI_INPUT_INDEX] = str(batch_input_dir.resolve())
+            return self._run_batch_command(cmd, batch_num, len(batch_files))
+
+    def _run_batch_command(self, cmd: CommandList, batch_num: int, files_count: int) -> dict[str, Any]:
+        try:
+            exit_code, stdout, stderr = self.executor.execute(cmd, timeout=self.options.timeout)
+            # stdout removed from call to _handle_photo_ai_result
+            success = self._handle_photo_ai_result(exit_code, stderr, batch_num)
+            return {
+                "batch_num": batch_num,
+                "success": success,
+                "exit_code": exit_code,
+                "files_count": files_count,
+                "stdout": stdout,
+                "stderr": stderr,
+            }
+        except Exception as e:
+            logger.error(f"Batch {batch_num} execution failed: {e}")
+            return {
+                "batch_num": batch_num,
+                "success": False,
+                "error": str(e),
+                "files_count": files_count,
+            }
 
     # stdout parameter removed
     def _handle_photo_ai_result(self, exit_code: int, stderr: str, batch_num: int) -> bool:
@@ -1,16 +1,70 @@
+from collections.abc import Mapping
 from pathlib import Path
+from types import MappingProxyType
 from typing import Any
 
 from loguru import logger
 
 from topyaz.core.errors import ValidationError
-from topyaz.core.types import CommandList
+from topyaz.core.types import CommandList, ParamSpec
+from topyaz.products.base import validate_param_schema
 
 # Corrected import path for PhotoAIPreferences
 from topyaz.products.photo_ai.preferences import PhotoAIPreferences
 
 PHOTOAI_MAX_QUALITY = 100
 PHOTOAI_MAX_COMPRESSION = 10
+PHOTOAI_VALID_FORMATS = frozenset({"preserve", "jpg", "jpeg", "png", "tif", "tiff", "dng"})
+PHOTOAI_VALID_BIT_DEPTHS = frozenset({8, 16})
+PHOTOAI_VALID_TIFF_COMPRESSION = frozenset({"none", "lzw", "zip"})
+PHOTOAI_AUTOPILOT_PARAMS = frozenset(
+    {
+        "face_strength",
+        "face_detection",
+        "face_parts",
+        "denoise_model",
+        "denoise_levels",
+        "denoise_strength",
+        "denoise_raw_model",
+        "denoise_raw_levels",
+        "denoise_raw_strength",
+        "sharpen_model",
+        "sharpen_levels",
+        "sharpen_strength",
+        "upscaling_model",
+        "upscaling_factor",
+        "upscaling_type",
+        "deblur_strength",
+        "denoise_upscale_strength",
+        "lighting_strength",
+        "raw_exposure_strength",
+        "adjust_color",
+        "temperature_value",
+        "opacity_value",
+        "resolution_unit",
+        "default_resolution",
+        "overwrite_files",
+        "recurse_directories",
+        "append_filters",
+    }
+)
+
+# Checked in this order by validate_params; the first violation is reported
+PHOTOAI_PARAM_SCHEMA: Mapping[str, ParamSpec] = MappingProxyType(
+    {
+        "format": ParamSpec("format", default="preserve", choices=PHOTOAI_VALID_FORMATS, noun="formats"),
+        "quality": ParamSpec("Quality", default=95, bounds=(0, PHOTOAI_MAX_QUALITY)),
+        "compression": ParamSpec("Compression", default=6, bounds=(0, PHOTOAI_MAX_COMPRESSION)),
+        "bit_depth": ParamSpec("Bit depth", default=8, choices=PHOTOAI_VALID_BIT_DEPTHS),
+        "tiff_compression": ParamSpec(
+            "TIFF compression", default="lzw", choices=PHOTOAI_VALID_TIFF_COMPRESSION, noun="options"
+        ),
+    }
+)
+
+# Slot of the input path in the list build_command returns, which always starts
+# [executable, "--cli", input, "-o", output, ...]; batches swap their staging dir in here
+PHOTOAI_CLI_INPUT_INDEX = 2
 
 
 class PhotoAIParams:
@@ -18,39 +72,11 @@ class PhotoAIParams:
         """
         Validate Photo AI parameters including enhanced autopilot settings.
         """
-        format_param = kwargs.get("format", "preserve")
-        quality = kwargs.get("quality", 95)
-        compression = kwargs.get("compression", 6)
-        bit_depth = kwargs.get("bit_depth", 8)
-        tiff_compression = kwargs.get("tiff_compression", "lzw")
-
-        valid_formats = {"preserve", "jpg", "jpeg", "png", "tif", "tiff", "dng"}
-        if format_param.lower() not in valid_formats:
-            msg = f"Invalid format '{format_param}'. Valid formats: {', '.join(sorted(valid_formats))}"
-            raise ValidationError(msg)
-
-        if not (0 <= quality <= PHOTOAI_MAX_QUALITY):
-            msg = f"Quality must be between 0 and {PHOTOAI_MAX_QUALITY}, got {quality}"
-            raise ValidationError(msg)
-
-        if not (0 <= compression <= PHOTOAI_MAX_COMPRESSION):
-            msg = f"Compression must be between 0 and {PHOTOAI_MAX_COMPRESSION}, got {compression}"
-            raise ValidationError(msg)
-
-        if bit_depth not in [8, 16]:
-            msg = f"Bit depth must be 8 or 16, got {bit_depth}"
-            raise ValidationError(msg)
-
-        valid_tiff_compression = {"none", "lzw", "zip"}
-        if tiff_compression.lower() not in valid_tiff_compression:
-            valid_options_str = ", ".join(sorted(valid_tiff_compression))
-            msg = f"Invalid TIFF compression '{tiff_compression}'. Valid options: {valid_options_str}"
-            raise ValidationError(msg)
+        validate_param_schema(PHOTOAI_PARAM_SCHEMA, kwargs)
 
         autopilot_params = {k: v for k, v in kwargs.items() if self._is_autopilot_param(k) and v is not None}
         if autopilot_params:
             try:
-                # from topyaz.system.photo_ai_prefs import PhotoAIPreferences # Moved to top
                 prefs_handler = PhotoAIPreferences()
                 prefs_handler.validate_setting_values(**autopilot_params)
             except ImportError:  # This might still occur if PhotoAIPreferences itself has import issues
@@ -60,36 +86,7 @@ class PhotoAIParams:
                 raise ValidationError(msg) from e
 
     def _is_autopilot_param(self, param_name: str) -> bool:
-        autopilot_params = {
-            "face_strength",
-            "face_detection",
-            "face_parts",
-            "denoise_model",
-            "denoise_levels",
-            "denoise_strength",
-            "denoise_raw_model",
-            "denoise_raw_levels",
-            "denoise_raw_strength",
-            "sharpen_model",
-            "sharpen_levels",
-            "sharpen_strength",
-            "upscaling_model",
-            "upscaling_factor",
-            "upscaling_type",
-            "deblur_strength",
-            "denoise_upscale_strength",
-            "lighting_strength",
-            "raw_exposure_strength",
-            "adjust_color",
-            "temperature_value",
-            "opacity_value",
-            "resolution_unit",
-            "default_resolution",
-            "overwrite_files",
-            "recurse_directories",
-            "append_filters",
-        }
-        return param_name in autopilot_params
+        return param_name in PHOTOAI_AUTOPILOT_PARAMS
 
     def build_command(
         self, executable: Path, input_path: Path, output_path: Path, *, verbose: bool, **kwargs: Any
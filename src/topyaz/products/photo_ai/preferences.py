@@ -7,13 +7,13 @@ This module provides comprehensive control over Topaz Photo AI's autopilot
 settings by manipulating the macOS preferences file before CLI execution.
 """
 
-import platform
 from dataclasses import dataclass, field
 from pathlib import Path
 from typing import Any, ClassVar  # Added ClassVar
 
 from loguru import logger
 
+from topyaz.system.host import PLATFORM_SYSTEM
 from topyaz.system.preferences import PreferenceHandler, PreferenceValidationError
 
 # Constants for PhotoAI preference validation
@@ -97,12 +97,12 @@ class PhotoAIPreferences(PreferenceHandler):
         super().__init__(preference_file)
 
     def _get_default_preference_path(self) -> Path:
-        if platform.system() == "Darwin":
+        if PLATFORM_SYSTEM == "Darwin":
             return Path.home() / "Library/Preferences/com.topazlabs.Topaz Photo AI.plist"
-        if platform.system() == "Windows":
+        if PLATFORM_SYSTEM == "Windows":
             msg = "Windows preferences manipulation not yet supported"
             raise RuntimeError(msg)
-        msg = f"Unsupported platform: {platform.system()}"
+        msg = f"Unsupported platform: {PLATFORM_SYSTEM}"
         raise RuntimeError(msg)
 
     def validate_preferences(self, preferences: dict[str, Any]) -> bool:
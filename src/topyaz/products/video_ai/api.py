@@ -9,10 +9,10 @@ for video upscaling, frame interpolation, and enhancement.
 """
 
 import os
-import platform
+import shlex
 import time  # Moved from process method
 from pathlib import Path
-from typing import Any
+from typing import Any, ClassVar
 
 from loguru import logger
 
@@ -22,6 +22,10 @@ from topyaz.core.types import CommandList, ProcessingOptions, ProcessingResult,
 from topyaz.execution.base import CommandExecutor
 from topyaz.products.base import MacOSTopazProduct
 from topyaz.products.video_ai.params import VideoAIParams  # Kept this direct import
+from topyaz.system.host import PLATFORM_SYSTEM
+
+# Progress fields parse_output extracts from FFmpeg output
+VIDEOAI_PROGRESS_KEYS = frozenset({"frames_processed", "time_processed", "processing_speed"})
 
 
 class VideoAI(MacOSTopazProduct):
@@ -37,6 +41,11 @@ class VideoAI(MacOSTopazProduct):
     - topyaz/products/base.py
     """
 
+    # Model-dir environment variables are process-wide, so set them up only once
+    _environment_ready: ClassVar[bool] = False
+    # (path, st_mtime_ns, st_size) of the last auth file found valid in this process
+    _auth_fingerprint: ClassVar[tuple[Path, int, int] | None] = None
+
     def __init__(self, executor: CommandExecutor, options: ProcessingOptions):
         """
         Initialize Video AI instance.
@@ -94,13 +103,13 @@ class VideoAI(MacOSTopazProduct):
 
     def get_search_paths(self) -> list[Path]:
         """Get platform-specific search paths for Video AI."""
-        if platform.system() == "Darwin":
+        if PLATFORM_SYSTEM == "Darwin":
             # macOS paths
             return [
                 Path("/Applications/Topaz Video AI.app/Contents/MacOS/ffmpeg"),
                 Path.home() / "Applications/Topaz Video AI.app/Contents/MacOS/ffmpeg",
             ]
-        if platform.system() == "Windows":
+        if PLATFORM_SYSTEM == "Windows":
             # Windows paths
             return [
                 Path("C:/Program Files/Topaz Labs LLC/Topaz Video AI/ffmpeg.exe"),
@@ -110,48 +119,68 @@ class VideoAI(MacOSTopazProduct):
         return [Path("/usr/local/bin/tvai-ffmpeg"), Path("/opt/video-ai/bin/ffmpeg")]
 
     def _setup_environment(self) -> None:
-        """Set up Video AI environment variables."""
-        try:
-            if platform.system() == "Darwin":
-                # macOS paths
-                model_dir = "/Applications/Topaz Video AI.app/Contents/Resources/models"
-                user_data_dir = str(Path.home() / "Library/Application Support/Topaz Labs LLC/Topaz Video AI/models")
-            elif platform.system() == "Windows":
-                # Windows paths
-                model_dir = "C:\\Program Files\\Topaz Labs LLC\\Topaz Video AI\\models"
-                user_data_dir = str(Path.home() / "AppData/Roaming/Topaz Labs LLC/Topaz Video AI/models")
-            else:
-                # Linux fallback
-                model_dir = "/opt/video-ai/models"
-                user_data_dir = str(Path.home() / "._config/topaz-video-ai/models")
-
-            # Set environment variables
-            os.environ["TVAI_MODEL_DIR"] = model_dir
-            os.environ["TVAI_MODEL_DATA_DIR"] = user_data_dir
-
-            logger.debug(f"Set TVAI_MODEL_DIR to: {model_dir}")
-            logger.debug(f"Set TVAI_MODEL_DATA_DIR to: {user_data_dir}")
-
-            # Validate authentication
-            self._validate_authentication()
-
-        except Exception as e:
-            logger.warning(f"Could not set up Video AI environment: {e}")
+        """Set up Video AI environment variables (once per process) and check authentication."""
+        if not VideoAI._environment_ready:
+            try:
+                if PLATFORM_SYSTEM == "Darwin":
+                    # macOS paths
+                    model_dir = "/Applications/Topaz Video AI.app/Contents/Resources/models"
+                    user_data_dir = str(
+                        Path.home() / "Library/Application Support/Topaz Labs LLC/Topaz Video AI/models"
+                    )
+                elif PLATFORM_SYSTEM == "Windows":
+                    # Windows paths
+                    model_dir = "C:\\Program Files\\Topaz Labs LLC\\Topaz Video AI\\models"
+                    user_data_dir = str(Path.home() / "AppData/Roaming/Topaz Labs LLC/Topaz Video AI/models")
+                else:
+                    # Linux fallback
+                    model_dir = "/opt/video-ai/models"
+                    user_data_dir = str(Path.home() / "._config/topaz-video-ai/models")
+
+                # Set environment variables
+                os.environ["TVAI_MODEL_DIR"] = model_dir
+                os.environ["TVAI_MODEL_DATA_DIR"] = user_data_dir
+
+                logger.debug(f"Set TVAI_MODEL_DIR to: {model_dir}")
+                logger.debug(f"Set TVAI_MODEL_DATA_DIR to: {user_data_dir}")
+                VideoAI._environment_ready = True
+
+            except Exception as e:
+                logger.warning(f"Could not set up Video AI environment: {e}")
+
+        # Checked for every instance; an unchanged auth file costs a single stat()
+        self._validate_authentication()
 
     def _validate_authentication(self) -> None:
         """Validate Video AI authentication."""
         try:
+            # Fast path: the auth file found earlier is unchanged, so skip re-probing
+            if VideoAI._auth_fingerprint is not None:
+                cached_path, mtime_ns, size = VideoAI._auth_fingerprint
+                try:
+                    stat = cached_path.stat()
+                except OSError:
+                    stat = None
+                if stat is not None and (stat.st_mtime_ns, stat.st_size) == (mtime_ns, size):
+                    return
+                VideoAI._auth_fingerprint = None
+
             auth_locations = self._get_auth_file_locations()
 
             for auth_path in auth_locations:
-                if auth_path.exists():
-                    logger.debug(f"Found Video AI auth file: {auth_path}")
-
-                    # Check if auth file is valid (basic existence check)
-                    if auth_path.stat().st_size > 0:
-                        logger.debug("Video AI authentication appears valid")
-                        return
-                    logger.warning(f"Video AI auth file is empty: {auth_path}")
+                # One stat() per candidate doubles as the existence check
+                try:
+                    stat = auth_path.stat()
+                except OSError:
+                    continue
+                logger.debug(f"Found Video AI auth file: {auth_path}")
+
+                # Non-empty is all we check: the file (auth.tpz can be large) is never read
+                if stat.st_size > 0:
+                    logger.debug("Video AI authentication appears valid")
+                    VideoAI._auth_fingerprint = (auth_path, stat.st_mtime_ns, stat.st_size)
+                    return
+                logger.warning(f"Video AI auth file is empty: {auth_path}")
 
             logger.debug("No Video AI auth files found - user may need to log in via GUI")
 
@@ -162,7 +191,7 @@ class VideoAI(MacOSTopazProduct):
         """Get potential authentication file locations."""
         locations = []
 
-        if platform.system() == "Darwin":
+        if PLATFORM_SYSTEM == "Darwin":
             # macOS locations
             base_path = Path.home() / "Library/Application Support/Topaz Labs LLC/Topaz Video AI"
             app_path = Path("/Applications/Topaz Video AI.app/Contents/Resources/models")
@@ -174,7 +203,7 @@ class VideoAI(MacOSTopazProduct):
             # Application bundle
             locations.append(app_path / "auth.tpz")
 
-        elif platform.system() == "Windows":
+        elif PLATFORM_SYSTEM == "Windows":
             # Windows locations
             base_path = Path.home() / "AppData/Roaming/Topaz Labs LLC/Topaz Video AI"
 
@@ -231,34 +260,37 @@ class VideoAI(MacOSTopazProduct):
         """
         info: dict[str, Any] = {}
 
-        # Parse FFmpeg progress output
+        # Only the latest value of each progress field is kept, so scan from the end
+        # and stop once all of them are found instead of parsing every line of a
+        # long run's log
         if stdout:
-            lines = stdout.split("\n")
-            for raw_line in lines:
+            for raw_line in reversed(stdout.splitlines()):
                 line = raw_line.strip()
 
-                # Parse progress information
-                if "frame=" in line:
+                if "frames_processed" not in info and "frame=" in line:
                     try:
                         frame_match = line.split("frame=")[1].split()[0]
                         info["frames_processed"] = int(frame_match)
                     except (IndexError, ValueError):
                         pass
 
-                if "time=" in line:
+                if "time_processed" not in info and "time=" in line:
                     try:
                         time_match = line.split("time=")[1].split()[0]
                         info["time_processed"] = time_match
                     except IndexError:
                         pass
 
-                if "speed=" in line:
+                if "processing_speed" not in info and "speed=" in line:
                     try:
                         speed_match = line.split("speed=")[1].split()[0]
                         info["processing_speed"] = speed_match
                     except IndexError:
                         pass
 
+                if info.keys() >= VIDEOAI_PROGRESS_KEYS:
+                    break
+
         # Parse error information
         if stderr:
             error_lines = [line.strip() for line in stderr.split("\n") if line.strip()]
@@ -353,7 +385,6 @@ class VideoAI(MacOSTopazProduct):
         Returns:
             Processing result
         """
-        # from topyaz.core.types import ProcessingResult # Moved to top
 
         # Convert to Path objects
         input_path = Path(input_path)
@@ -362,7 +393,7 @@ class VideoAI(MacOSTopazProduct):
 
         # Validate inputs
         self.validate_input_path(input_path)
-        self.validate_params(**kwargs)
+        self.validate_params_once(**kwargs)
 
         # Determine final output path
         if output_path:
@@ -385,7 +416,7 @@ class VideoAI(MacOSTopazProduct):
             logger.info(f"Processing {input_path} with {self.product_name}")
 
             if self.options.dry_run:
-                logger.info(f"DRY RUN: Would execute: {' '.join(command)}")
+                logger.info(f"DRY RUN: Would execute: {shlex.join(command)}")
                 return ProcessingResult(
                     success=True,
                     input_path=input_path,
@@ -398,9 +429,8 @@ class VideoAI(MacOSTopazProduct):
                     file_size_after=0,
                 )
 
-                # import time # Moved to top
             start_time = time.time()
-            file_size_before = input_path.stat().st_size if input_path.is_file() else 0
+            file_size_before = self._file_size(input_path)
 
             # Execute the command
             exit_code, stdout, stderr = self.executor.execute(command, timeout=self.options.timeout)
@@ -425,7 +455,7 @@ class VideoAI(MacOSTopazProduct):
                 )
 
             # Get file size after processing
-            file_size_after = final_output_path.stat().st_size if final_output_path.exists() else 0
+            file_size_after = self._file_size(final_output_path)
 
             # Parse output for additional information
             parsed_info = self.parse_output(stdout, stderr)
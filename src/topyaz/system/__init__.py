@@ -16,10 +16,13 @@ from topyaz.system.gpu import (
     MetalGPUDetector,
     NvidiaGPUDetector,
 )
+from topyaz.system.host import PLATFORM_SYSTEM, PlatformInfo, get_platform_info
 from topyaz.system.memory import MemoryManager
 from topyaz.system.paths import PathManager, PathValidator
 
 __all__ = [
+    # Host platform
+    "PLATFORM_SYSTEM",
     "AMDGPUDetector",
     # Environment
     "EnvironmentValidator",
@@ -34,4 +37,6 @@ __all__ = [
     "PathManager",
     # Paths
     "PathValidator",
+    "PlatformInfo",
+    "get_platform_info",
 ]
@@ -8,20 +8,27 @@ available memory, disk space, and other system prerequisites.
 
 """
 
-import platform
-import shutil
+import time
+from collections.abc import Callable
 from pathlib import Path
 from typing import Any
 
-import psutil
 from loguru import logger
 
 from topyaz.core.errors import TopyazEnvironmentError
 from topyaz.core.types import SystemRequirements
+from topyaz.system.gpu import get_gpu_tools
+from topyaz.system.host import get_platform_info
+
+# psutil is imported inside the methods that read it, so CLI paths that never look at
+# system resources (``version``, ``--help``, processing without diagnostics) skip its
+# import cost.
 
 # Constants for environment validation
 WINDOWS_MIN_MAJOR_VERSION = 10
 LOW_MEMORY_WARNING_GB = 2
+# Seconds a psutil memory/disk reading is shared between info and validation checks
+ENV_PROBE_TTL = 5.0
 
 
 class EnvironmentValidator:
@@ -51,6 +58,31 @@ class EnvironmentValidator:
         """
         self.requirements = requirements or SystemRequirements()
         self._validation_results: dict[str, bool] = {}
+        self._probe_cache: dict[str, tuple[float, Any]] = {}
+
+    def _probe(self, key: str, read: Callable[[], Any]) -> Any:
+        """
+        Return a psutil reading, reusing one taken within ``ENV_PROBE_TTL`` seconds.
+
+        ``topyaz info`` reports system information and then validates the
+        environment; both read memory and home-directory disk usage, so the
+        second pass reuses the first pass's readings.
+
+        Args:
+            key: Cache key identifying the reading
+            read: Zero-argument callable performing the reading
+
+        Returns:
+            The (possibly cached) reading
+
+        """
+        now = time.monotonic()
+        cached = self._probe_cache.get(key)
+        if cached is not None and now - cached[0] < ENV_PROBE_TTL:
+            return cached[1]
+        value = read()
+        self._probe_cache[key] = (now, value)
+        return value
 
     def validate_all(self, *, raise_on_error: bool = True) -> dict[str, bool]:
         """
@@ -98,7 +130,7 @@ class EnvironmentValidator:
             EnvironmentError: If OS version is incompatible and raise_on_error is True
 
         """
-        system = platform.system()
+        system = get_platform_info().system
 
         if system == "Darwin":  # macOS
             return self._validate_macos_version(raise_on_error=raise_on_error)
@@ -113,7 +145,7 @@ class EnvironmentValidator:
     def _validate_macos_version(self, *, raise_on_error: bool) -> bool:
         """Validate macOS version."""
         try:
-            version_str = platform.mac_ver()[0]
+            version_str = get_platform_info().mac_version
             if not version_str:
                 logger.warning("Could not determine macOS version")
                 return True  # Assume compatible if can't determine
@@ -142,7 +174,7 @@ class EnvironmentValidator:
     def _validate_windows_version(self, *, raise_on_error: bool) -> bool:
         """Validate Windows version."""
         # Windows 10+ is generally compatible
-        version = platform.version()
+        version = get_platform_info().version
         logger.debug(f"Windows version: {version}")
 
         # Basic check for Windows 10+
@@ -175,8 +207,10 @@ class EnvironmentValidator:
             EnvironmentError: If insufficient memory and raise_on_error is True
 
         """
+        import psutil  # noqa: PLC0415
+
         required_gb = required_gb or self.requirements.min_memory_gb
-        memory = psutil.virtual_memory()
+        memory = self._probe("memory", psutil.virtual_memory)
         total_gb = memory.total / (1024**3)
         available_gb = memory.available / (1024**3)
 
@@ -212,11 +246,13 @@ class EnvironmentValidator:
             EnvironmentError: If insufficient space and raise_on_error is True
 
         """
+        import psutil  # noqa: PLC0415
+
         required_gb = required_gb or self.requirements.min_disk_space_gb
         check_path = path or Path.home()
 
         try:
-            disk_usage = psutil.disk_usage(str(check_path))
+            disk_usage = self._probe(f"disk:{check_path}", lambda: psutil.disk_usage(str(check_path)))
             free_gb = disk_usage.free / (1024**3)
             total_gb = disk_usage.total / (1024**3)
 
@@ -267,14 +303,15 @@ class EnvironmentValidator:
         gpu_available = False
 
         # Check for common GPU utilities
-        if platform.system() == "Darwin":
+        gpu_tools = get_gpu_tools()
+        if get_platform_info().system == "Darwin":
             # macOS always has Metal support on modern systems
             gpu_available = True
             logger.debug("macOS Metal GPU support available")
-        elif shutil.which("nvidia-smi"):
+        elif gpu_tools["nvidia-smi"]:
             gpu_available = True
             logger.debug("NVIDIA GPU detected")
-        elif shutil.which("rocm-smi"):
+        elif gpu_tools["rocm-smi"]:
             gpu_available = True
             logger.debug("AMD GPU detected")
 
@@ -318,17 +355,15 @@ class EnvironmentValidator:
         Used in:
         - topyaz/cli.py
         """
-        memory = psutil.virtual_memory()
-        disk = psutil.disk_usage(Path.home())
+        import psutil  # noqa: PLC0415
+
+        platform_info = get_platform_info()
+        memory = self._probe("memory", psutil.virtual_memory)
+        home = Path.home()
+        disk = self._probe(f"disk:{home}", lambda: psutil.disk_usage(str(home)))
 
         info: dict[str, Any] = {
-            "platform": {
-                "system": platform.system(),
-                "release": platform.release(),
-                "version": platform.version(),
-                "machine": platform.machine(),
-                "processor": platform.processor(),
-            },
+            "platform": {key: value for key, value in platform_info._asdict().items() if key != "mac_version"},
             "memory": {
                 "total_gb": round(memory.total / (1024**3), 2),
                 "available_gb": round(memory.available / (1024**3), 2),
@@ -346,7 +381,7 @@ class EnvironmentValidator:
         }
 
         # Add macOS specific info
-        if platform.system() == "Darwin":
-            info["macos_version"] = platform.mac_ver()[0]
+        if platform_info.system == "Darwin":
+            info["macos_version"] = platform_info.mac_version
 
         return info
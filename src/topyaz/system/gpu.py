@@ -8,12 +8,18 @@ and vendors (NVIDIA, AMD, Intel, Apple Metal).
 
 """
 
+import atexit
+import functools
 import json
 import platform
 import re  # Moved from MetalGPUDetector.detect
 import shutil
 import subprocess
 from abc import ABC, abstractmethod
+from collections.abc import Callable, Mapping
+from dataclasses import replace
+from types import MappingProxyType, ModuleType
+from typing import Any, ClassVar, TypeVar
 
 # from typing import Optional # F401: Unused import
 from loguru import logger
@@ -22,6 +28,72 @@ from topyaz.core.types import GPUInfo, GPUStatus
 
 NVIDIA_SMI_MIN_EXPECTED_PARTS = 7
 
+_Number = TypeVar("_Number", int, float)
+
+# Vendor command-line tools probed on PATH, in order of detector preference
+GPU_TOOLS = ("nvidia-smi", "rocm-smi", "intel_gpu_top")
+
+
+@functools.lru_cache(maxsize=1)
+def get_gpu_tools() -> Mapping[str, bool]:
+    """
+    Report which GPU vendor tools are available on PATH.
+
+    Each shutil.which() call walks $PATH, and detectors, the GPU manager and the
+    environment validator all ask the same question, so the answer is computed
+    once per process.
+
+    Returns:
+        Read-only mapping of tool name to availability, shared by all callers
+
+    Used in:
+    - topyaz/system/environment.py
+    """
+    return MappingProxyType({tool: shutil.which(tool) is not None for tool in GPU_TOOLS})
+
+
+@functools.lru_cache(maxsize=1)
+def load_nvml() -> ModuleType | None:
+    """
+    Import and initialize the optional NVML bindings (``pip install topyaz[nvml]``).
+
+    NVML answers the same queries as ``nvidia-smi`` in-process, without a
+    fork/exec and CSV parse per probe. Initialization happens once per process
+    and is paired with an ``nvmlShutdown`` at exit.
+
+    Returns:
+        The initialized ``pynvml`` module, or None if it is missing or NVML
+        cannot be initialized (no driver, no device)
+
+    """
+    try:
+        import pynvml  # noqa: PLC0415
+
+        nvml: ModuleType = pynvml
+        nvml.nvmlInit()
+    except Exception as e:
+        logger.debug(f"NVML unavailable, falling back to nvidia-smi: {e}")
+        return None
+
+    atexit.register(nvml.nvmlShutdown)
+    return nvml
+
+
+def _nvml_query(nvml: ModuleType, query: Callable[..., Any], *args: Any) -> Any:
+    """Run an NVML query, returning None for fields the device doesn't support."""
+    try:
+        return query(*args)
+    except nvml.NVMLError:
+        return None
+
+
+def _parse_number(convert: Callable[[str], _Number], value: str) -> _Number | None:
+    """Convert an nvidia-smi CSV field, returning None for "[N/A]" and similar."""
+    try:
+        return convert(value)
+    except ValueError:
+        return None
+
 
 class GPUDetector(ABC):
     """
@@ -68,22 +140,26 @@ class GPUDetector(ABC):
 
 
 class NvidiaGPUDetector(GPUDetector):
-    """NVIDIA GPU detection using nvidia-smi.
+    """NVIDIA GPU detection using NVML, falling back to nvidia-smi.
 
     Used in:
     - topyaz/system/__init__.py
     """
 
     def detect(self) -> GPUStatus:
-        """Detect NVIDIA GPUs using nvidia-smi."""
-        if not shutil.which("nvidia-smi"):
+        """Detect NVIDIA GPUs via NVML if available, otherwise nvidia-smi."""
+        nvml = load_nvml()
+        if nvml is not None:
+            return self._detect_with_nvml(nvml)
+
+        if not get_gpu_tools()["nvidia-smi"]:
             return GPUStatus(available=False, errors=["nvidia-smi not found"])
 
         # Query GPU information
         cmd = [
             "nvidia-smi",
             "--query-gpu=name,memory.total,memory.used,memory.free,utilization.gpu,temperature.gpu,power.draw",
-            "--format_output=csv,noheader,nounits",
+            "--format=csv,noheader,nounits",
         ]
 
         success, stdout, stderr = self._run_command(cmd)
@@ -92,30 +168,67 @@ class NvidiaGPUDetector(GPUDetector):
             return GPUStatus(available=False, errors=[f"nvidia-smi failed: {stderr}"])
 
         devices = []
-        for i, line in enumerate(stdout.strip().split("\n")):
-            if not line.strip():
+        for i, line in enumerate(stdout.splitlines()):
+            parts = line.split(",")
+            if len(parts) < NVIDIA_SMI_MIN_EXPECTED_PARTS:
                 continue
 
-            parts = [p.strip() for p in line.split(",")]
-            if len(parts) >= NVIDIA_SMI_MIN_EXPECTED_PARTS:
-                try:
-                    device = GPUInfo(
-                        name=parts[0],
-                        type="nvidia",
-                        memory_total_mb=int(parts[1]) if parts[1].isdigit() else None,
-                        memory_used_mb=int(parts[2]) if parts[2].isdigit() else None,
-                        memory_free_mb=int(parts[3]) if parts[3].isdigit() else None,
-                        utilization_percent=int(parts[4]) if parts[4].isdigit() else None,
-                        temperature_c=int(parts[5]) if parts[5].isdigit() else None,
-                        power_draw_w=float(parts[6]) if parts[6].replace(".", "").isdigit() else None,
-                        device_id=i,
-                    )
-                    devices.append(device)
-                except (ValueError, IndexError) as e:
-                    logger.debug(f"Failed to parse NVIDIA GPU info: {e}")
+            # int()/float() tolerate the space padding nvidia-smi emits, so only the
+            # name needs stripping; "[N/A]" fields become None instead of dropping the device
+            devices.append(
+                GPUInfo(
+                    name=parts[0].strip(),
+                    type="nvidia",
+                    memory_total_mb=_parse_number(int, parts[1]),
+                    memory_used_mb=_parse_number(int, parts[2]),
+                    memory_free_mb=_parse_number(int, parts[3]),
+                    utilization_percent=_parse_number(int, parts[4]),
+                    temperature_c=_parse_number(int, parts[5]),
+                    power_draw_w=_parse_number(float, parts[6]),
+                    device_id=i,
+                )
+            )
 
         return GPUStatus(available=len(devices) > 0, devices=devices)
 
+    def _detect_with_nvml(self, nvml: ModuleType) -> GPUStatus:
+        """Detect NVIDIA GPUs through the in-process NVML bindings."""
+        try:
+            count = nvml.nvmlDeviceGetCount()
+        except nvml.NVMLError as e:
+            return GPUStatus(available=False, errors=[f"NVML query failed: {e}"])
+
+        devices = []
+        errors = []
+        for i in range(count):
+            try:
+                handle = nvml.nvmlDeviceGetHandleByIndex(i)
+                name = nvml.nvmlDeviceGetName(handle)
+            except nvml.NVMLError as e:
+                # A lost or inaccessible device should not hide the others
+                errors.append(f"NVML query failed for device {i}: {e}")
+                continue
+            memory = _nvml_query(nvml, nvml.nvmlDeviceGetMemoryInfo, handle)
+            utilization = _nvml_query(nvml, nvml.nvmlDeviceGetUtilizationRates, handle)
+            power_mw = _nvml_query(nvml, nvml.nvmlDeviceGetPowerUsage, handle)
+
+            devices.append(
+                GPUInfo(
+                    # Older bindings return bytes
+                    name=name.decode() if isinstance(name, bytes) else name,
+                    type="nvidia",
+                    memory_total_mb=memory.total // (1024 * 1024) if memory else None,
+                    memory_used_mb=memory.used // (1024 * 1024) if memory else None,
+                    memory_free_mb=memory.free // (1024 * 1024) if memory else None,
+                    utilization_percent=utilization.gpu if utilization else None,
+                    temperature_c=_nvml_query(nvml, nvml.nvmlDeviceGetTemperature, handle, nvml.NVML_TEMPERATURE_GPU),
+                    power_draw_w=power_mw / 1000 if power_mw is not None else None,
+                    device_id=i,
+                )
+            )
+
+        return GPUStatus(available=len(devices) > 0, devices=devices, errors=errors)
+
 
 class AMDGPUDetector(GPUDetector):
     """AMD GPU detection using rocm-smi.
@@ -126,7 +239,7 @@ class AMDGPUDetector(GPUDetector):
 
     def detect(self) -> GPUStatus:
         """Detect AMD GPUs using rocm-smi."""
-        if not shutil.which("rocm-smi"):
+        if not get_gpu_tools()["rocm-smi"]:
             return GPUStatus(available=False, errors=["rocm-smi not found"])
 
         # Query basic GPU information
@@ -168,7 +281,7 @@ class IntelGPUDetector(GPUDetector):
     def detect(self) -> GPUStatus:
         """Detect Intel GPUs."""
         # Intel GPU detection is platform-specific and less standardized
-        if shutil.which("intel_gpu_top"):
+        if get_gpu_tools()["intel_gpu_top"]:
             return GPUStatus(available=True, devices=[GPUInfo(name="Intel GPU", type="intel", device_id=0)])
 
         return GPUStatus(available=False, errors=["Intel GPU tools not found"])
@@ -181,11 +294,28 @@ class MetalGPUDetector(GPUDetector):
     - topyaz/system/__init__.py
     """
 
+    # system_profiler takes 1-3 s per call, and the Metal device descriptors it reports
+    # (name, VRAM) cannot change while the process runs, so one successful probe is
+    # shared by every detector instance (each TopyazCLI builds its own GPUManager).
+    _cached_devices: ClassVar[list[GPUInfo] | None] = None
+
     def detect(self) -> GPUStatus:
         """Detect Metal GPUs on macOS using system_profiler."""
         if platform.system() != "Darwin":
             return GPUStatus(available=False, errors=["Metal GPU detection only available on macOS"])
 
+        if MetalGPUDetector._cached_devices is None:
+            status = self._probe_devices()
+            if status.errors:
+                return status
+            MetalGPUDetector._cached_devices = status.devices
+
+        # Hand out copies so callers can't mutate the shared descriptors
+        devices = [replace(device) for device in MetalGPUDetector._cached_devices]
+        return GPUStatus(available=len(devices) > 0, devices=devices)
+
+    def _probe_devices(self) -> GPUStatus:
+        """Query system_profiler for Metal GPU devices."""
         # Use system_profiler to get GPU info
         cmd = ["system_profiler", "SPDisplaysDataType", "-json"]
 
@@ -224,7 +354,6 @@ class MetalGPUDetector(GPUDetector):
                     # Parse VRAM if possible
                     if vram and isinstance(vram, str):
                         # Extract memory size from strings like "8 GB" or "8192 MB"
-                        # import re # Moved to top
 
                         match = re.search(r"(\d+)\s*(GB|MB)", vram, re.IGNORECASE)
                         if match:
@@ -280,13 +409,15 @@ class GPUManager:
             return MetalGPUDetector()
 
         # For other platforms, try in order of preference
-        if shutil.which("nvidia-smi"):
+        gpu_tools = get_gpu_tools()
+
+        if gpu_tools["nvidia-smi"]:
             return NvidiaGPUDetector()
 
-        if shutil.which("rocm-smi"):
+        if gpu_tools["rocm-smi"]:
             return AMDGPUDetector()
 
-        if shutil.which("intel_gpu_top"):
+        if gpu_tools["intel_gpu_top"]:
             return IntelGPUDetector()
 
         # Fallback - return a dummy detector
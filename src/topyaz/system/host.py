@@ -0,0 +1,52 @@
+#!/usr/bin/env python3
+# this_file: src/topyaz/system/host.py
+"""
+Host platform description for topyaz.
+
+The host OS cannot change while the process runs, so it is read here once and
+shared by the product modules and the environment checks.
+"""
+
+import functools
+import platform
+from typing import NamedTuple
+
+# Resolved once at import: the products branch on it in their path lookups
+PLATFORM_SYSTEM = platform.system()
+
+
+class PlatformInfo(NamedTuple):
+    """Details of the host platform.
+
+    Used in:
+    - topyaz/system/environment.py
+    """
+
+    system: str
+    release: str
+    version: str
+    machine: str
+    processor: str
+    mac_version: str  # Empty off macOS
+
+
+@functools.lru_cache(maxsize=1)
+def get_platform_info() -> PlatformInfo:
+    """
+    Describe the host platform once per process.
+
+    Read on first use rather than at import: ``platform.processor()`` can spawn
+    ``uname -p`` and ``platform.mac_ver()`` reads ``SystemVersion.plist``.
+
+    Returns:
+        Immutable platform details; ``system`` is ``PLATFORM_SYSTEM``
+
+    """
+    return PlatformInfo(
+        system=PLATFORM_SYSTEM,
+        release=platform.release(),
+        version=platform.version(),
+        machine=platform.machine(),
+        processor=platform.processor(),
+        mac_version=platform.mac_ver()[0],
+    )
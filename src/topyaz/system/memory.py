@@ -8,14 +8,18 @@ for different Topaz products based on available system resources.
 
 """
 
-# from typing import Optional # F401: Unused import
-from typing import Any, ClassVar  # Added ClassVar
+import re
+import time
+from typing import Any, ClassVar
 
-import psutil
 from loguru import logger
 
 from topyaz.core.types import MemoryConstraints, Product
 
+# psutil is imported inside the methods that read it, so CLI paths that never look at
+# system resources (``version``, ``--help``, processing without diagnostics) skip its
+# import cost.
+
 # Constants for memory thresholds and recommendations
 HIGH_MEMORY_PERCENT_CRITICAL = 90
 HIGH_MEMORY_PERCENT_WARNING = 85
@@ -26,6 +30,34 @@ GIGAPIXEL_AVAILABLE_GB_LOW_WARN = 4
 GIGAPIXEL_AVAILABLE_GB_CONSTRAINED_WARN = 8
 PHOTO_AI_AVAILABLE_GB_VERY_LOW_WARN = 2
 
+# How long a psutil.virtual_memory() reading is reused by the sizing checks (seconds)
+MEMORY_SNAPSHOT_TTL = 1.0
+
+# Error-message keywords that point at memory exhaustion, matched in one pass
+MEMORY_ERROR_PATTERN = re.compile(
+    "|".join(
+        re.escape(keyword)
+        for keyword in ("memory", "ram", "allocation", "out of memory", "oom", "insufficient", "failed to allocate")
+    ),
+    re.IGNORECASE,
+)
+
+# Recommendation messages, built once rather than on every constraint check
+MSG_MEMORY_CRITICAL = f"Critical: Memory usage above {HIGH_MEMORY_PERCENT_CRITICAL}% - close other applications"
+MSG_MEMORY_HIGH = f"High memory usage (>{HIGH_MEMORY_PERCENT_WARNING}%) detected - consider reducing batch size"
+MSG_MEMORY_LOW = f"Low available memory (<{LOW_MEMORY_GB_THRESHOLD_GENERIC}GB) - process files in smaller batches"
+MSG_VIDEO_AI_LOW = f"Video AI: Less than {VIDEO_AI_MIN_AVAILABLE_GB_WARN}GB available - process one video at a time"
+MSG_VIDEO_AI_UPGRADE = (
+    f"Video AI: Consider upgrading to {VIDEO_AI_TOTAL_GB_RECOMMEND_UPGRADE}GB+ RAM for better performance"
+)
+MSG_GIGAPIXEL_LOW = f"Gigapixel: Low memory (<{GIGAPIXEL_AVAILABLE_GB_LOW_WARN}GB) may cause processing failures"
+MSG_GIGAPIXEL_CONSTRAINED = (
+    f"Gigapixel: Available memory <{GIGAPIXEL_AVAILABLE_GB_CONSTRAINED_WARN}GB - Reduce batch size to 5-10 images"
+)
+MSG_PHOTO_AI_VERY_LOW = (
+    f"Photo AI: Very low memory (<{PHOTO_AI_AVAILABLE_GB_VERY_LOW_WARN}GB) - process in small batches"
+)
+
 
 class MemoryManager:
     """
@@ -56,6 +88,28 @@ class MemoryManager:
         """Initialize memory manager."""
         self._initial_memory: Any = None
         self._peak_usage = 0
+        self._mem_cache: tuple[float, Any] = (0.0, None)
+
+    def _memory_snapshot(self) -> Any:
+        """
+        Return a recent ``psutil.virtual_memory()`` reading.
+
+        Readings are reused for ``MEMORY_SNAPSHOT_TTL`` seconds so batch-sizing
+        loops don't re-read ``/proc/meminfo`` (or call ``host_statistics``) per
+        file. Monitoring methods bypass this and always read fresh values.
+
+        Returns:
+            psutil ``svmem`` named tuple
+
+        """
+        now = time.monotonic()
+        taken_at, memory = self._mem_cache
+        if memory is None or now - taken_at >= MEMORY_SNAPSHOT_TTL:
+            import psutil  # noqa: PLC0415
+
+            memory = psutil.virtual_memory()
+            self._mem_cache = (now, memory)
+        return memory
 
     def check_constraints(self, operation_type: str | Product = "processing") -> MemoryConstraints:
         """
@@ -68,7 +122,7 @@ class MemoryManager:
             MemoryConstraints object with current status and recommendations
 
         """
-        memory = psutil.virtual_memory()
+        memory = self._memory_snapshot()
 
         constraints = MemoryConstraints(
             available_gb=memory.available / (1024**3),
@@ -92,48 +146,31 @@ class MemoryManager:
                 product = Product.PHOTO_AI
 
         # General memory constraint checks
+        recommendations = constraints.recommendations
         if memory.percent > HIGH_MEMORY_PERCENT_CRITICAL:
-            constraints.recommendations.append(
-                f"Critical: Memory usage above {HIGH_MEMORY_PERCENT_CRITICAL}% - close other applications"
-            )
+            recommendations.append(MSG_MEMORY_CRITICAL)
         elif memory.percent > HIGH_MEMORY_PERCENT_WARNING:
-            constraints.recommendations.append(
-                f"High memory usage (>{HIGH_MEMORY_PERCENT_WARNING}%) detected - consider reducing batch size"
-            )
+            recommendations.append(MSG_MEMORY_HIGH)
 
         if constraints.available_gb < LOW_MEMORY_GB_THRESHOLD_GENERIC:
-            constraints.recommendations.append(
-                f"Low available memory (<{LOW_MEMORY_GB_THRESHOLD_GENERIC}GB) - process files in smaller batches"
-            )
+            recommendations.append(MSG_MEMORY_LOW)
 
         # Product-specific recommendations
         if product == Product.VIDEO_AI:
             if constraints.available_gb < VIDEO_AI_MIN_AVAILABLE_GB_WARN:
-                constraints.recommendations.append(
-                    f"Video AI: Less than {VIDEO_AI_MIN_AVAILABLE_GB_WARN}GB available - process one video at a time"
-                )
+                recommendations.append(MSG_VIDEO_AI_LOW)
             if constraints.total_gb < VIDEO_AI_TOTAL_GB_RECOMMEND_UPGRADE:
-                constraints.recommendations.append(
-                    f"Video AI: Consider upgrading to {VIDEO_AI_TOTAL_GB_RECOMMEND_UPGRADE}GB+ RAM "
-                    f"for better performance"
-                )
+                recommendations.append(MSG_VIDEO_AI_UPGRADE)
 
         elif product == Product.GIGAPIXEL:
             if constraints.available_gb < GIGAPIXEL_AVAILABLE_GB_LOW_WARN:
-                constraints.recommendations.append(
-                    f"Gigapixel: Low memory (<{GIGAPIXEL_AVAILABLE_GB_LOW_WARN}GB) may cause processing failures"
-                )
+                recommendations.append(MSG_GIGAPIXEL_LOW)
             if constraints.available_gb < GIGAPIXEL_AVAILABLE_GB_CONSTRAINED_WARN:
-                constraints.recommendations.append(
-                    f"Gigapixel: Available memory <{GIGAPIXEL_AVAILABLE_GB_CONSTRAINED_WARN}GB - "
-                    f"Reduce batch size to 5-10 images"
-                )
+                recommendations.append(MSG_GIGAPIXEL_CONSTRAINED)
 
         elif product == Product.PHOTO_AI:
             if constraints.available_gb < PHOTO_AI_AVAILABLE_GB_VERY_LOW_WARN:
-                constraints.recommendations.append(
-                    f"Photo AI: Very low memory (<{PHOTO_AI_AVAILABLE_GB_VERY_LOW_WARN}GB) - process in small batches"
-                )
+                recommendations.append(MSG_PHOTO_AI_VERY_LOW)
 
         logger.debug(
             f"Memory check for {operation_type}: "
@@ -168,7 +205,7 @@ class MemoryManager:
         if file_count == 0:
             return 0
 
-        memory = psutil.virtual_memory()
+        memory = self._memory_snapshot()
         available_mb = memory.available / (1024**2)
 
         # Reserve minimum free memory
@@ -224,6 +261,8 @@ class MemoryManager:
 
     def start_monitoring(self) -> None:
         """Start memory monitoring for an operation."""
+        import psutil  # noqa: PLC0415
+
         self._initial_memory = psutil.virtual_memory()
         self._peak_usage = self._initial_memory.used
         logger.debug(f"Memory monitoring started: {self._initial_memory.percent:.1f}% used")
@@ -239,6 +278,10 @@ class MemoryManager:
         if self._initial_memory is None:
             self.start_monitoring()
 
+        import psutil  # noqa: PLC0415
+
+        # Keep running aggregates only, not a per-sample history: each update is
+        # O(1) however long the monitored job runs.
         current_memory = psutil.virtual_memory()
         self._peak_usage = max(self._peak_usage, current_memory.used)
 
@@ -281,12 +324,9 @@ class MemoryManager:
 
         """
         suggestions = []
-        error_lower = error_message.lower()
 
         # Check for memory-related keywords
-        memory_keywords = ["memory", "ram", "allocation", "out of memory", "oom", "insufficient", "failed to allocate"]
-
-        if any(keyword in error_lower for keyword in memory_keywords):
+        if MEMORY_ERROR_PATTERN.search(error_message):
             current_memory = self.check_constraints(operation_type)
 
             suggestions.append("Memory issue detected. Try:")
@@ -330,7 +370,7 @@ class MemoryManager:
             Tuple of (can_process, reason_if_not)
 
         """
-        memory = psutil.virtual_memory()
+        memory = self._memory_snapshot()
         available_mb = memory.available / (1024**2)
 
         # Determine memory requirement
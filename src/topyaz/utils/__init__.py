@@ -7,12 +7,16 @@ This module contains utility functions and classes for logging,
 validation, and other common operations.
 """
 
+from typing import TYPE_CHECKING, Any
+
 from topyaz.utils.logging import logger, setup_logging
-from topyaz.utils.validation import (
-    compare_media_files,
-    enhance_processing_result,
-    validate_output_file,
-)
+
+if TYPE_CHECKING:
+    from topyaz.utils.validation import compare_media_files, enhance_processing_result, validate_output_file
+
+# Validation helpers pull in Pillow, which nothing on the CLI startup path needs, so
+# they are imported on first attribute access (PEP 562) rather than with the package.
+_LAZY_VALIDATION = frozenset({"compare_media_files", "enhance_processing_result", "validate_output_file"})
 
 __all__ = [
     "compare_media_files",
@@ -21,3 +25,20 @@ __all__ = [
     "setup_logging",
     "validate_output_file",
 ]
+
+
+def __getattr__(name: str) -> Any:
+    """Resolve the validation helpers on first access."""
+    if name in _LAZY_VALIDATION:
+        from topyaz.utils import validation  # noqa: PLC0415
+
+        value = getattr(validation, name)
+        globals()[name] = value
+        return value
+    msg = f"module {__name__!r} has no attribute {name!r}"
+    raise AttributeError(msg)
+
+
+def __dir__() -> list[str]:
+    """List the lazy helpers alongside the already-loaded names."""
+    return sorted({*globals(), *__all__})
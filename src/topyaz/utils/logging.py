@@ -8,6 +8,13 @@ import sys
 
 from loguru import logger
 
+# Console record format, shared by verbose and quiet modes
+LOG_FORMAT = (
+    "<green>{time:YYYY-MM-DD HH:mm:ss}</green> | "
+    "<level>{level: <8}</level> | "
+    "<cyan>{name}:{function}:{line}</cyan> - <level>{message}</level>"
+)
+
 
 def setup_logging(*, verbose: bool = True) -> None:  # Added *
     """
@@ -18,12 +25,18 @@ def setup_logging(*, verbose: bool = True) -> None:  # Added *
     """
     logger.remove()
     log_level = "DEBUG" if verbose else "INFO"
-    log_format = (
-        "<green>{time:YYYY-MM-DD HH:mm:ss}</green> | "
-        "<level>{level: <8}</level> | "
-        "<cyan>{name}:{function}:{line}</cyan> - <level>{message}</level>"
+    # Write straight to stderr from the calling thread (no queue, no file sink).
+    # Extended, variable-annotated tracebacks are only worth their cost in verbose mode.
+    # No filter callback: the level threshold is the only per-record check.
+    logger.add(
+        sys.stderr,
+        format=LOG_FORMAT,
+        level=log_level,
+        colorize=True,
+        enqueue=False,
+        backtrace=verbose,
+        diagnose=verbose,
     )
-    logger.add(sys.stderr, format=log_format, level=log_level, colorize=True)
     logger.info(f"Logging configured at {log_level} level.")
 
 
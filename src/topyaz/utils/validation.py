@@ -114,8 +114,6 @@ def _get_video_info(file_path: Path) -> dict[str, Any]:
     info: dict[str, Any] = {}
 
     try:
-        # import shutil # Moved to top
-
         ffprobe_path = shutil.which("ffprobe")
         if not ffprobe_path:
             logger.warning("ffprobe executable not found in PATH.")
@@ -128,7 +126,6 @@ def _get_video_info(file_path: Path) -> dict[str, Any]:
         result = subprocess.run(cmd, capture_output=True, text=True, timeout=30, check=False)  # noqa: S603
 
         if result.returncode == 0:
-            # import json # Moved to top
             data = json.loads(result.stdout)
 
             # Extract format_output info
@@ -174,7 +171,6 @@ def _get_image_info(file_path: Path) -> dict[str, Any]:
 
     try:
         # Try using PIL/Pillow if available
-        # from PIL import Image # Moved to top
         with Image.open(file_path) as img:
             info["width"] = img.width
             info["height"] = img.height
@@ -3,6 +3,7 @@
 Tests for the configuration management in topyaz.core.config.
 """
 
+import io
 import os
 from pathlib import Path
 from unittest import mock
@@ -10,7 +11,7 @@ from unittest import mock
 import pytest
 import yaml
 
-from topyaz.core.config import Config
+from topyaz.core.config import _DEFAULT_CONFIG, Config
 from topyaz.core.types import ConfigDict
 
 
@@ -30,6 +31,18 @@ def mock_home_dir(tmp_path: Path) -> Path:
         yield home_dir
 
 
+def test_default_config_is_a_fresh_mutable_copy():
+    """Config.DEFAULT_CONFIG stays a plain dict; edits to it never reach the built-in defaults."""
+    defaults = Config.DEFAULT_CONFIG
+    assert type(defaults) is dict
+    assert type(defaults["video"]) is dict
+    defaults["video"]["default_model"] = "changed"
+    defaults["paths"]["_gigapixel"]["macos"].append("/elsewhere")
+
+    assert Config.DEFAULT_CONFIG["video"]["default_model"] == "amq-13"
+    assert "/elsewhere" not in Config.DEFAULT_CONFIG["paths"]["_gigapixel"]["macos"]
+
+
 def test_config_initialization_no_file(mock_home_dir: Path, default_config_data: ConfigDict):
     cfg = Config()
     assert cfg.config_file == mock_home_dir / ".topyaz" / "_config.yaml"
@@ -60,6 +73,23 @@ def test_config_loading_from_yaml(mock_home_dir: Path, default_config_data: Conf
     assert cfg.get("defaults.timeout") == default_config_data["defaults"]["timeout"]
 
 
+def test_config_file_parse_is_cached(tmp_path: Path):
+    config_path = tmp_path / "cached_config.yaml"
+    config_path.write_text(yaml.safe_dump({"video": {"default_model": "prob-3"}}))
+    with mock.patch("topyaz.core.config.yaml.load", wraps=yaml.load) as mock_load:
+        first = Config(config_file=config_path)
+        first.set("video.default_model", "mutated")
+        second = Config(config_file=config_path)
+        assert mock_load.call_count == 1
+        assert second.get("video.default_model") == "prob-3"
+
+        # Rewriting the file changes its size/mtime, which invalidates the cache entry
+        config_path.write_text(yaml.safe_dump({"video": {"default_model": "ahq-12"}}))
+        third = Config(config_file=config_path)
+        assert mock_load.call_count == 2
+        assert third.get("video.default_model") == "ahq-12"
+
+
 def test_config_get_method(default_config_data: ConfigDict):
     cfg = Config()
     assert cfg.get("defaults.log_level") == default_config_data["defaults"]["log_level"]
@@ -152,6 +182,16 @@ def test_config_to_dict(default_config_data: ConfigDict):
     assert cfg.get("defaults.log_level") == default_config_data["defaults"]["log_level"]
 
 
+def test_default_template_is_isolated(default_config_data: ConfigDict):
+    cfg = Config()
+    cfg.get("paths._gigapixel.macos").append("/tmp/extra")  # noqa: S108
+    cfg.set("defaults.log_level", "DEBUG")
+    assert "/tmp/extra" not in Config().get("paths._gigapixel.macos")  # noqa: S108
+    assert default_config_data["defaults"]["log_level"] == "INFO"
+    with pytest.raises(TypeError):
+        _DEFAULT_CONFIG["defaults"]["log_level"] = "DEBUG"
+
+
 def test_empty_config_file(mock_home_dir: Path, default_config_data: ConfigDict):
     config_path = mock_home_dir / ".topyaz" / "_config.yaml"
     config_path.touch()
@@ -159,13 +199,43 @@ def test_empty_config_file(mock_home_dir: Path, default_config_data: ConfigDict)
     assert cfg.config == default_config_data
 
 
-def test_malformed_config_file(mock_home_dir: Path, default_config_data: ConfigDict, caplog):  # caplog is used
+def test_malformed_config_file(mock_home_dir: Path, default_config_data: ConfigDict):
     config_path = mock_home_dir / ".topyaz" / "_config.yaml"
-    with open(config_path, "w") as f:
-        f.write("defaults: [not a dict]")
+    config_path.write_text("defaults: [not a dict]")
     cfg = Config()
     assert cfg.config == default_config_data
-    # The warning "Config merge conflict for key 'defaults'" is confirmed to be logged to stderr.
-    # However, caplog.records/messages might not reliably capture loguru output here
-    # without specific loguru-pytest propagation setup.
-    # The main functional check (cfg.config == default_config_data) is the most important.
+    # The "Config merge conflict for key 'defaults'" warning goes to loguru's stderr
+    # sink; the functional check (cfg.config == default_config_data) is what matters.
+
+
+def test_invalid_yaml_config_file(mock_home_dir: Path, default_config_data: ConfigDict):
+    config_path = mock_home_dir / ".topyaz" / "_config.yaml"
+    config_path.write_text("defaults: {unclosed")
+    cfg = Config()
+    assert cfg.config == default_config_data
+
+
+@pytest.mark.parametrize(
+    ("yaml_text", "expected_model"),
+    [
+        pytest.param("", "amq-13", id="empty"),
+        pytest.param("defaults: {unclosed", "amq-13", id="unparsable"),
+        pytest.param(yaml.safe_dump({"video": {"default_model": "prob-3"}}), "prob-3", id="override"),
+    ],
+)
+def test_load_from_stream(yaml_text: str, expected_model: str):
+    config = Config()._load_from_stream(io.StringIO(yaml_text))
+    assert config["video"]["default_model"] == expected_model
+    assert config["defaults"]["log_level"] == "INFO"
+
+
+def test_config_file_is_loaded_through_stream_loader(tmp_path: Path):
+    config_path = tmp_path / "streamed_config.yaml"
+    config_path.write_text(yaml.safe_dump({"video": {"device": 1}}))
+    with mock.patch.object(
+        Config, "_load_from_stream", autospec=True, side_effect=Config._load_from_stream
+    ) as mock_stream:
+        cfg = Config(config_file=config_path)
+
+    assert mock_stream.call_count == 1
+    assert cfg.get("video.device") == 1
@@ -0,0 +1,87 @@
+# this_file: tests/products/conftest.py
+"""
+Shared fixtures for the product API tests.
+
+Each product test module names the product it covers with a module-level
+``PRODUCT_CLASS``. One mock executor and one product instance are built per
+module; the autouse reset and the ``product`` snapshot keep tests independent.
+
+Modules also list their numeric ranges as ``BOUNDED_PARAMS`` rows of
+``(param, low, high, label)``; tests taking ``bad_value`` are parametrized
+with one out-of-range case per side of each range.
+"""
+
+import re
+from collections.abc import Iterable
+from types import SimpleNamespace
+from typing import Any
+from unittest.mock import Mock
+
+import pytest
+
+from topyaz.core.types import ProcessingOptions
+from topyaz.products.base import TopazProduct
+
+# Canned (exit code, stdout, stderr) results for the mocked executor.
+EXEC_RESULTS = SimpleNamespace(
+    ok=(0, "Processing completed", ""),
+    fail=(1, "", "Processing failed"),
+    ok_silent=(0, "", ""),
+)
+
+
+@pytest.fixture(scope="module")
+def mock_executor() -> Mock:
+    """Mock executor shared by the tests of one module."""
+    return Mock()
+
+
+@pytest.fixture(scope="module")
+def processing_options() -> ProcessingOptions:
+    """Processing options for testing."""
+    return ProcessingOptions(verbose=False, dry_run=False)
+
+
+@pytest.fixture(scope="session")
+def exec_results() -> SimpleNamespace:
+    """``EXEC_RESULTS``: ``ok``, ``fail`` and ``ok_silent`` results for ``mock_executor.execute``."""
+    return EXEC_RESULTS
+
+
+@pytest.fixture(autouse=True)
+def _reset_mock_executor(mock_executor: Mock):
+    """Clear calls and configured results so the module-scoped mock starts fresh per test."""
+    yield
+    mock_executor.reset_mock(return_value=True, side_effect=True)
+
+
+@pytest.fixture(scope="module")
+def shared_product(
+    request: pytest.FixtureRequest, mock_executor: Mock, processing_options: ProcessingOptions
+) -> TopazProduct:
+    """One instance of the module's ``PRODUCT_CLASS``, built once per module."""
+    return request.module.PRODUCT_CLASS(mock_executor, processing_options)
+
+
+@pytest.fixture
+def product(shared_product: TopazProduct):
+    """The module's product, put back to its freshly built state after each test."""
+    state = dict(vars(shared_product))
+    yield shared_product
+    vars(shared_product).clear()
+    vars(shared_product).update(state)
+
+
+def bounds_cases(table: Iterable[tuple[str, int, int, str]]) -> list[Any]:
+    """Expand ``(param, low, high, label)`` ranges into ``(param, bad_value, message)`` cases."""
+    return [
+        pytest.param(param, value, re.escape(f"{label} must be between {low} and {high}"), id=f"{param}-{side}")
+        for param, low, high, label in table
+        for side, value in (("below", low - 1), ("above", high + 1))
+    ]
+
+
+def pytest_generate_tests(metafunc: pytest.Metafunc) -> None:
+    """Parametrize tests taking ``bad_value`` from the module's ``BOUNDED_PARAMS``."""
+    if "bad_value" in metafunc.fixturenames:
+        metafunc.parametrize(("param", "bad_value", "message"), bounds_cases(metafunc.module.BOUNDED_PARAMS))
@@ -1,13 +1,15 @@
 # this_file: tests/products/gigapixel/test_api.py
-import os
+from itertools import pairwise
 from pathlib import Path
-from unittest.mock import Mock, patch
+from types import MappingProxyType, SimpleNamespace
+from unittest.mock import Mock, call, patch
 
 import pytest
 
 # ProcessingError and ProcessingResult removed as they were unused.
 from topyaz.core.errors import ValidationError
-from topyaz.core.types import ProcessingOptions
+from topyaz.core.types import ParamSpec, ProcessingOptions
+from topyaz.products.base import _format_choices, clear_executable_cache, validate_param_schema
 from topyaz.products.gigapixel.api import (
     GIGA_MAX_CREATIVITY_TEXTURE,
     GIGA_MAX_EFFECT_STRENGTH,
@@ -17,21 +19,77 @@ from topyaz.products.gigapixel.api import (
     GigapixelAI,
 )
 
+PRODUCT_CLASS = GigapixelAI
+
+# Numeric ranges as (parameter, low, high, error label); see bounds_cases in conftest.py.
+BOUNDED_PARAMS = (
+    ("scale", 1, GIGA_MAX_SCALE, "Scale"),
+    *[
+        (param, 1, GIGA_MAX_EFFECT_STRENGTH, param)
+        for param in ("denoise", "sharpen", "compression", "detail", "face_recovery")
+    ],
+    *[(param, 1, GIGA_MAX_CREATIVITY_TEXTURE, param) for param in ("creativity", "texture")],
+    ("quality_output", 1, GIGA_MAX_QUALITY, "Quality"),
+    ("parallel_read", 1, GIGA_MAX_PARALLEL_READ, "Parallel read"),
+)
 
-@pytest.fixture
-def mock_executor() -> Mock:
-    return Mock()
+# Relative input/output paths for the build_command tests.
+IN_JPG = Path("input.jpg")
+OUT_JPG = Path("output_dir/output.jpg")
+IN_PNG = Path("in.png")
+OUT_PNG = Path("out/final.png")
+
+# Every optional Gigapixel parameter, and the flag/value pairs build_command should emit for them.
+GIGA_ALL_PARAMS = MappingProxyType(
+    {
+        "model": "art",
+        "scale": 4,
+        "denoise": 30,
+        "sharpen": 70,
+        "compression": 10,
+        "detail": 60,
+        "creativity": 3,
+        "texture": 4,
+        "prompt": "test prompt",
+        "face_recovery": 80,
+        "face_recovery_version": 1,
+        "format_output": "png",
+        "bit_depth": 16,
+        "parallel_read": 3,
+    }
+)
 
+GIGA_EXPECTED_CLI_ARGS = MappingProxyType(
+    {
+        "model": "art",
+        "scale": "4",
+        "denoise": "30",
+        "sharpen": "70",
+        "compression": "10",
+        "detail": "60",
+        "creativity": "3",
+        "texture": "4",
+        "prompt": "test prompt",
+        "face-recovery": "80",
+        "face-recovery-version": "1",
+        "format-output": "png",
+        "bit-depth": "16",
+        "parallel-read": "3",
+    }
+)
 
-@pytest.fixture
-def processing_options() -> ProcessingOptions:
-    return ProcessingOptions(verbose=False, dry_run=False)
+
+@pytest.fixture(scope="module")
+def input_image(tmp_path_factory: pytest.TempPathFactory) -> Path:
+    """One empty input image shared by the tests that only need it to exist."""
+    path = tmp_path_factory.mktemp("gigapixel") / "input.jpg"
+    path.touch()
+    return path
 
 
 @pytest.fixture
-def gigapixel_api(mock_executor: Mock, processing_options: ProcessingOptions) -> GigapixelAI:
-    with patch.object(GigapixelAI, "find_executable", return_value=Path("/fake/gigapixel_cli")):
-        yield GigapixelAI(mock_executor, processing_options)
+def gigapixel_api(product: GigapixelAI) -> GigapixelAI:
+    return product
 
 
 class TestGigapixelAPI:
@@ -44,152 +102,129 @@ class TestGigapixelAPI:
         with pytest.raises(ValidationError, match="Invalid model"):
             gigapixel_api.validate_params(model="invalid_model")
 
-    def test_validate_params_invalid_scale(self, gigapixel_api: GigapixelAI):
-        with pytest.raises(ValidationError, match=f"Scale must be between 1 and {GIGA_MAX_SCALE}"):
-            gigapixel_api.validate_params(scale=GIGA_MAX_SCALE + 1)
-        with pytest.raises(ValidationError, match=f"Scale must be between 1 and {GIGA_MAX_SCALE}"):
-            gigapixel_api.validate_params(scale=0)
-
-    def test_validate_params_invalid_effect_strength(self, gigapixel_api: GigapixelAI):
-        for param in ["denoise", "sharpen", "compression", "detail", "face_recovery"]:
-            with pytest.raises(ValidationError, match=f"{param} must be between 1 and {GIGA_MAX_EFFECT_STRENGTH}"):
-                gigapixel_api.validate_params(**{param: GIGA_MAX_EFFECT_STRENGTH + 1})
-            with pytest.raises(ValidationError, match=f"{param} must be between 1 and {GIGA_MAX_EFFECT_STRENGTH}"):
-                gigapixel_api.validate_params(**{param: 0})
-
-    def test_validate_params_invalid_creativity_texture(self, gigapixel_api: GigapixelAI):
-        for param in ["creativity", "texture"]:
-            with pytest.raises(ValidationError, match=f"{param} must be between 1 and {GIGA_MAX_CREATIVITY_TEXTURE}"):
-                gigapixel_api.validate_params(**{param: GIGA_MAX_CREATIVITY_TEXTURE + 1})
-            with pytest.raises(ValidationError, match=f"{param} must be between 1 and {GIGA_MAX_CREATIVITY_TEXTURE}"):
-                gigapixel_api.validate_params(**{param: 0})
-
-    def test_validate_params_invalid_quality(self, gigapixel_api: GigapixelAI):
-        with pytest.raises(ValidationError, match=f"Quality must be between 1 and {GIGA_MAX_QUALITY}"):
-            gigapixel_api.validate_params(quality_output=GIGA_MAX_QUALITY + 1)
-        with pytest.raises(ValidationError, match=f"Quality must be between 1 and {GIGA_MAX_QUALITY}"):
-            gigapixel_api.validate_params(quality_output=0)
-
-    def test_validate_params_invalid_parallel_read(self, gigapixel_api: GigapixelAI):
-        with pytest.raises(ValidationError, match=f"Parallel read must be between 1 and {GIGA_MAX_PARALLEL_READ}"):
-            gigapixel_api.validate_params(parallel_read=GIGA_MAX_PARALLEL_READ + 1)
-        with pytest.raises(ValidationError, match=f"Parallel read must be between 1 and {GIGA_MAX_PARALLEL_READ}"):
-            gigapixel_api.validate_params(parallel_read=0)
+    def test_validate_params_out_of_range(self, gigapixel_api: GigapixelAI, param: str, bad_value: int, message: str):
+        with pytest.raises(ValidationError, match=message):
+            gigapixel_api.validate_params(**{param: bad_value})
+
+    @pytest.mark.parametrize(
+        ("params", "message"),
+        [
+            ({"face_recovery_version": 3}, "Face recovery version must be 1 or 2, got 3"),
+            ({"bit_depth": 12}, "Bit depth must be 0, 8, or 16, got 12"),
+            (
+                {"format_output": "gif"},
+                "Invalid format_output 'gif'. Valid formats: jpeg, jpg, png, preserve, tif, tiff",
+            ),
+        ],
+    )
+    def test_validate_params_choice_messages(self, gigapixel_api: GigapixelAI, params, message):
+        with pytest.raises(ValidationError) as exc_info:
+            gigapixel_api.validate_params(**params)
+        assert str(exc_info.value) == message
+
+    def test_validate_params_model_case_insensitive(self, gigapixel_api: GigapixelAI):
+        gigapixel_api.validate_params(model="High Fidelity", format_output="PNG")
+
+    def test_validate_params_none_uses_default(self, gigapixel_api: GigapixelAI):
+        """An explicit None is validated as the parameter's default rather than skipped."""
+        gigapixel_api.validate_params(model=None, scale=None, quality_output=None)
+
+        schema = {"scale": ParamSpec("Scale", default=9, bounds=(1, GIGA_MAX_SCALE))}
+        with pytest.raises(ValidationError, match=f"Scale must be between 1 and {GIGA_MAX_SCALE}, got 9"):
+            validate_param_schema(schema, {"scale": None})
+
+    @pytest.mark.parametrize(
+        ("choices", "expected"),
+        [
+            (frozenset({8}), "8"),
+            (frozenset({16, 8}), "8 or 16"),
+            (frozenset({16, 0, 8}), "0, 8, or 16"),
+            (frozenset({8, None}), "8 or None"),
+        ],
+    )
+    def test_format_choices_inline(self, choices: frozenset, expected: str):
+        """Non-string choice sets render as an inline list, including single and mixed-type sets."""
+        assert _format_choices(choices) == (expected, False)
+
+    def test_validate_params_once_skips_repeated_valid_params(self, gigapixel_api: GigapixelAI):
+        with patch.object(gigapixel_api, "validate_params", wraps=gigapixel_api.validate_params) as mock_validate:
+            gigapixel_api.validate_params_once(model="std", scale=2)
+            gigapixel_api.validate_params_once(model="std", scale=2)
+            assert mock_validate.call_count == 1
+
+            gigapixel_api.validate_params_once(model="std", scale=4)
+            assert mock_validate.call_count == 2
+
+            # Equal but differently typed values are validated again
+            gigapixel_api.validate_params_once(model="std", scale=4.0)
+            assert mock_validate.call_count == 3
+
+            for _ in range(2):
+                with pytest.raises(ValidationError):
+                    gigapixel_api.validate_params_once(model="std", scale=0)
+            assert mock_validate.call_count == 5
 
     def test_build_command_simple(self, gigapixel_api: GigapixelAI):
-        cmd = gigapixel_api.build_command(Path("input.jpg"), Path("output_dir/output.jpg"), model="std", scale=2)
-        cmd_str = " ".join(cmd)
-        assert str(gigapixel_api.get_executable_path()) in cmd_str
-        assert "--cli" in cmd_str
-        assert "-i" in cmd_str
-        assert "input.jpg" in cmd_str
-        assert "-o" in cmd_str
-        assert "output.jpg" in cmd_str
-        assert "--model std" in cmd_str
-        assert "--scale 2" in cmd_str
-        assert "--verbose" not in cmd_str
-
-    def test_build_command_all_params(self, gigapixel_api: GigapixelAI):  # mock_executor and processing_options removed
-        original_verbose = gigapixel_api.options.verbose
-        try:
-            gigapixel_api.options.verbose = True
-            api_verbose = gigapixel_api
-
-            params = {
-                "model": "art",
-                "scale": 4,
-                "denoise": 30,
-                "sharpen": 70,
-                "compression": 10,
-                "detail": 60,
-                "creativity": 3,
-                "texture": 4,
-                "prompt": "test prompt",
-                "face_recovery": 80,
-                "face_recovery_version": 1,
-                "format_output": "png",
-                "bit_depth": 16,
-                "parallel_read": 3,
-            }
-            cmd = api_verbose.build_command(Path("in.png"), Path("out/final.png"), **params)
-
-            assert "--verbose" in cmd
-            expected_args = {
-                "model": "art",
-                "scale": "4",
-                "denoise": "30",
-                "sharpen": "70",
-                "compression": "10",
-                "detail": "60",
-                "creativity": "3",
-                "texture": "4",
-                "prompt": "test prompt",
-                "face-recovery": "80",
-                "face-recovery-version": "1",
-                "format-output": "png",
-                "bit-depth": "16",
-                "parallel-read": "3",
-            }
-            cmd_str = " ".join(cmd)
-            for key_cli, value_str in expected_args.items():
-                assert f"--{key_cli} {value_str}" in cmd_str
-            assert "--quality" not in cmd_str
-        finally:
-            gigapixel_api.options.verbose = original_verbose  # Ensure restoration
-
-    def test_parse_output_simple(self, gigapixel_api: GigapixelAI):
-        stdout = "Model: std\nScale: 2x\nProcessing time: 10.5s\nMemory used: 1024MB"
-        stderr = ""
-        parsed = gigapixel_api.parse_output(stdout, stderr)
-        assert parsed.get("model_used") == "std"
-        assert parsed.get("scale_used") == 2
-        assert parsed.get("processing_time") == "10.5s"
-        assert parsed.get("memory_used") == "1024MB"
-
-    def test_parse_output_licensing_error(self, gigapixel_api: GigapixelAI):
-        stdout = "Gigapixel CLI requires a Pro license. Please contact enterprise@topazlabs.com"
+        cmd = gigapixel_api.build_command(IN_JPG, OUT_JPG, model="std", scale=2)
+        pairs = set(pairwise(cmd))
+        assert cmd[:2] == [str(gigapixel_api.get_executable_path()), "--cli"]
+        assert ("-i", str(IN_JPG.resolve())) in pairs
+        assert ("-o", str(OUT_JPG.resolve())) in pairs
+        assert ("--model", "std") in pairs
+        assert ("--scale", "2") in pairs
+        assert "--verbose" not in cmd
+
+    def test_build_command_all_params(self, gigapixel_api: GigapixelAI, monkeypatch: pytest.MonkeyPatch):
+        monkeypatch.setattr(gigapixel_api.options, "verbose", True)
+
+        cmd = gigapixel_api.build_command(IN_PNG, OUT_PNG, **GIGA_ALL_PARAMS)
+
+        assert "--verbose" in cmd
+        pairs = set(pairwise(cmd))
+        for key_cli, value_str in GIGA_EXPECTED_CLI_ARGS.items():
+            assert (f"--{key_cli}", value_str) in pairs
+        assert not any(arg.startswith("--quality") for arg in cmd)
+
+    @pytest.mark.parametrize(
+        ("stdout", "expected"),
+        [
+            pytest.param(
+                "Model: std\nScale: 2x\nProcessing time: 10.5s\nMemory used: 1024MB",
+                {"model_used": "std", "scale_used": 2, "processing_time": "10.5s", "memory_used": "1024MB"},
+                id="simple",
+            ),
+            pytest.param(
+                "Gigapixel CLI requires a Pro license. Please contact enterprise@topazlabs.com",
+                {"licensing_error": True},
+                id="licensing-error",
+            ),
+            pytest.param("False", {"licensing_error": True}, id="false-for-license"),
+        ],
+    )
+    def test_parse_output(self, gigapixel_api: GigapixelAI, stdout: str, expected: dict):
         parsed = gigapixel_api.parse_output(stdout, "")
-        assert parsed.get("licensing_error") is True
-        assert "Pro license" in parsed.get("user_message", "")
+        assert expected.items() <= parsed.items()
 
-    def test_parse_output_false_for_license(self, gigapixel_api: GigapixelAI):
-        stdout = "False"
+    def test_parse_output_licensing_message(self, gigapixel_api: GigapixelAI):
+        stdout = "Gigapixel CLI requires a Pro license. Please contact enterprise@topazlabs.com"
         parsed = gigapixel_api.parse_output(stdout, "")
-        assert parsed.get("licensing_error") is True
+        assert "Pro license" in parsed.get("user_message", "")
 
-    def test_process_success(self, gigapixel_api: GigapixelAI, mock_executor: Mock, tmp_path: Path):
-        input_file = tmp_path / "input.jpg"
-        input_file.touch()
-        final_output_path = tmp_path / "final_output.jpg"
+    def test_process_success(
+        self, gigapixel_api: GigapixelAI, mock_executor: Mock, input_image: Path, exec_results: SimpleNamespace
+    ):
+        input_file = input_image
+        final_output_path = input_image.with_name("final_output.jpg")
         mock_temp_output_file = Path("/tmp/fake_temp_dir_placeholder/input.jpg")  # noqa: S108
 
-        mock_executor.execute.return_value = (0, "Success", "")
+        mock_executor.execute.return_value = exec_results.ok
 
         with (
             patch.object(GigapixelAI, "_find_output_file", return_value=mock_temp_output_file) as mock_find_actual,
             patch("shutil.move") as mock_move_actual,
-            patch("os.stat") as mock_os_stat_actual,
+            patch.object(GigapixelAI, "_file_size", side_effect={input_file: 1000, final_output_path: 2000}.get),
         ):
 
-            def stat_side_effect(*args, **_kwargs):  # Changed kwargs to _kwargs
-                path_arg = Path(args[0])
-                stat_result_mock = Mock(spec=os.stat_result)
-                if path_arg == input_file:
-                    stat_result_mock.st_size = 1000
-                    stat_result_mock.st_mode = 0o100644
-                elif path_arg == final_output_path:
-                    stat_result_mock.st_size = 2000
-                    stat_result_mock.st_mode = 0o100644
-                elif path_arg == tmp_path or path_arg == final_output_path.parent or path_arg == input_file.parent:
-                    stat_result_mock.st_mode = 0o040755
-                    stat_result_mock.st_size = 4096
-                else:
-                    error_msg = f"[Errno 2] Mock os.stat: No such file or directory: '{path_arg!s}'"
-                    raise FileNotFoundError(error_msg)
-                return stat_result_mock
-
-            mock_os_stat_actual.side_effect = stat_side_effect
-
             def move_side_effect(src, dst):
                 pass
 
@@ -199,27 +234,97 @@ class TestGigapixelAPI:
 
             assert result.success is True
             assert result.output_path == final_output_path
-            mock_executor.execute.assert_called_once()
-            mock_find_actual.assert_called_once()
-            mock_move_actual.assert_called_once_with(str(mock_temp_output_file), str(final_output_path))
+            assert mock_executor.execute.call_count == 1
+            assert mock_find_actual.call_count == 1
+            assert mock_move_actual.call_args_list == [call(str(mock_temp_output_file), str(final_output_path))]
             assert result.file_size_before == 1000
             assert result.file_size_after == 2000
 
-    def test_process_failure_execution(self, gigapixel_api: GigapixelAI, mock_executor: Mock, tmp_path: Path):
-        input_file = tmp_path / "input.jpg"
-        input_file.touch()
-        output_file = tmp_path / "output.jpg"
-        mock_executor.execute.return_value = (1, "", "Error details")
+    def test_file_size_counts_regular_files_only(self, gigapixel_api: GigapixelAI, tmp_path: Path):
+        image = tmp_path / "image.jpg"
+        image.write_bytes(b"x" * 10)
+
+        assert gigapixel_api._file_size(image) == 10
+        assert gigapixel_api._file_size(tmp_path) == 0
+        assert gigapixel_api._file_size(tmp_path / "missing.jpg") == 0
+
+    def test_process_failure_execution(
+        self, gigapixel_api: GigapixelAI, mock_executor: Mock, input_image: Path, exec_results: SimpleNamespace
+    ):
+        input_file = input_image
+        output_file = input_image.with_name("output.jpg")
+        mock_executor.execute.return_value = exec_results.fail
         result = gigapixel_api.process(str(input_file), output_path=str(output_file))
         assert result.success is False
-        assert "processing failed (exit code 1): error details" in result.error_message.lower()
-
-    def test_process_dry_run(self, gigapixel_api: GigapixelAI, mock_executor: Mock, tmp_path: Path):
-        gigapixel_api.options.dry_run = True
-        input_file = tmp_path / "input.jpg"
-        input_file.touch()
-        output_file = tmp_path / "output.jpg"
+        assert "processing failed (exit code 1): processing failed" in result.error_message.lower()
+
+    @pytest.fixture
+    def fresh_executable_cache(self):
+        """Start and finish with an empty shared executable cache."""
+        clear_executable_cache()
+        yield
+        clear_executable_cache()
+
+    @pytest.mark.no_executable_mock
+    @pytest.mark.usefixtures("fresh_executable_cache")
+    def test_find_executable_is_shared_across_instances(
+        self, mock_executor: Mock, processing_options: ProcessingOptions, tmp_path: Path
+    ):
+        fake_binary = tmp_path / "gigapixel"
+        fake_binary.touch(mode=0o755)
+
+        with patch.object(GigapixelAI, "get_search_paths", return_value=[fake_binary]) as mock_search:
+            first = GigapixelAI(mock_executor, processing_options).find_executable()
+            second = GigapixelAI(mock_executor, processing_options).find_executable()
+
+        assert first == second == fake_binary
+        mock_search.assert_called_once()
+
+    @pytest.mark.no_executable_mock
+    @pytest.mark.usefixtures("fresh_executable_cache")
+    @pytest.mark.parametrize("same_instance", [False, True], ids=["new-instance", "same-instance"])
+    def test_find_executable_rechecks_cached_path(
+        self, mock_executor: Mock, processing_options: ProcessingOptions, tmp_path: Path, *, same_instance: bool
+    ):
+        """A remembered executable that has since been removed triggers a fresh search."""
+        removed = tmp_path / "old" / "gigapixel"
+        removed.parent.mkdir()
+        removed.touch(mode=0o755)
+        fake_binary = tmp_path / "gigapixel"
+        fake_binary.touch(mode=0o755)
+
+        with patch.object(GigapixelAI, "get_search_paths", side_effect=[[removed], [fake_binary]]):
+            first_api = GigapixelAI(mock_executor, processing_options)
+            first = first_api.find_executable()
+            removed.unlink()
+            second_api = first_api if same_instance else GigapixelAI(mock_executor, processing_options)
+            second = second_api.find_executable()
+
+        assert (first, second) == (removed, fake_binary)
+
+    @pytest.mark.no_executable_mock
+    @pytest.mark.usefixtures("fresh_executable_cache")
+    def test_find_executable_skips_non_executable_candidates(
+        self, mock_executor: Mock, processing_options: ProcessingOptions, tmp_path: Path
+    ):
+        not_executable = tmp_path / "stale" / "gigapixel"
+        not_executable.parent.mkdir()
+        not_executable.touch(mode=0o644)
+        fake_binary = tmp_path / "gigapixel"
+        fake_binary.touch(mode=0o755)
+
+        with patch.object(GigapixelAI, "get_search_paths", return_value=[not_executable, fake_binary]):
+            found = GigapixelAI(mock_executor, processing_options).find_executable()
+
+        assert found == fake_binary
+
+    def test_process_dry_run(
+        self, gigapixel_api: GigapixelAI, mock_executor: Mock, input_image: Path, monkeypatch: pytest.MonkeyPatch
+    ):
+        monkeypatch.setattr(gigapixel_api.options, "dry_run", True)
+        input_file = input_image
+        output_file = input_image.with_name("output.jpg")
         result = gigapixel_api.process(str(input_file), output_path=str(output_file))
         assert result.success is True
         assert "DRY RUN" in result.stdout
-        mock_executor.execute.assert_not_called()
+        assert mock_executor.execute.call_count == 0
@@ -4,9 +4,9 @@
 Benchmark tests for topyaz performance measurement.
 """
 
-import tempfile
+import itertools
 from pathlib import Path
-from unittest.mock import Mock, patch
+from unittest.mock import Mock
 
 import pytest
 
@@ -24,10 +24,39 @@ from topyaz.system.memory import MemoryManager
 from topyaz.utils.validation import validate_output_file
 
 
+def _stress_combinations(n_models: int, n_scales: int, n_denoises: int) -> tuple[tuple[str, int, int], ...]:
+    """Every (model, scale, denoise) combination for one stress-benchmark workload size."""
+    denoises = range(1, 101, 100 // n_denoises)[:n_denoises]
+    return tuple(itertools.product(("std", "art", "low")[:n_models], range(1, n_scales + 1), denoises))
+
+
+# Stress-benchmark workloads as (models, scales, denoise levels), so the report shows how
+# validation cost scales with the number of combinations
+STRESS_WORKLOADS = [
+    pytest.param(_stress_combinations(*size), id="x".join(map(str, size)))
+    for size in ((1, 2, 2), (3, 6, 5), (3, 6, 20))
+]
+
+
+@pytest.fixture(scope="module")
+def dry_run_inputs(tmp_path_factory: pytest.TempPathFactory) -> tuple[str, str]:
+    """One image and one video input reused by every dry-run benchmark iteration.
+
+    Each product validates the input extension, so the video product needs a
+    video file rather than the image used by the others.
+    """
+    directory = tmp_path_factory.mktemp("benchmark")
+    image_file = directory / "input.jpg"
+    video_file = directory / "input.mp4"
+    image_file.write_bytes(b"\xff\xd8\xff")
+    video_file.touch()
+    return str(image_file), str(video_file)
+
+
 class TestBenchmarks:
     """Benchmark tests for performance measurement."""
 
-    @pytest.mark.benchmark
+    @pytest.mark.benchmark(group="startup")
     def test_cli_initialization_benchmark(self, benchmark):
         """Benchmark CLI initialization performance."""
 
@@ -37,7 +66,7 @@ class TestBenchmarks:
         result = benchmark(init_cli)
         assert result is not None
 
-    @pytest.mark.benchmark
+    @pytest.mark.benchmark(group="startup")
     def test_product_lazy_loading_benchmark(self, benchmark):
         """Benchmark product lazy loading performance."""
 
@@ -49,7 +78,7 @@ class TestBenchmarks:
         result = benchmark(load_products)
         assert len(result) == 3
 
-    @pytest.mark.benchmark
+    @pytest.mark.benchmark(group="system")
     def test_config_loading_benchmark(self, benchmark):
         """Benchmark configuration loading performance."""
 
@@ -59,160 +88,120 @@ class TestBenchmarks:
         result = benchmark(load_config)
         assert result is not None
 
-    @pytest.mark.benchmark
+    @pytest.mark.benchmark(group="products")
     def test_parameter_validation_benchmark(self, benchmark):
         """Benchmark parameter validation performance."""
 
-        def validate_params():
-            executor = Mock()
-            options = ProcessingOptions()
-
-            with patch(
-                "topyaz.products.gigapixel.api.GigapixelAI.find_executable", return_value=Path("/fake/gigapixel")
-            ):
-                gp = GigapixelAI(executor, options)
-                gp.validate_params(model="std", scale=2, denoise=50)
-
-            with patch("topyaz.products.video_ai.api.VideoAI.find_executable", return_value=Path("/fake/ffmpeg")):
-                video = VideoAI(executor, options)
-                video.validate_params(model="amq-13", scale=2, quality=18)
-
-            with patch("topyaz.products.photo_ai.api.PhotoAI.find_executable", return_value=Path("/fake/tpai")):
-                photo = PhotoAI(executor, options)
-                photo.validate_params(format="jpg", quality=95)
+        executor = Mock()
+        options = ProcessingOptions()
+        gp = GigapixelAI(executor, options)
+        video = VideoAI(executor, options)
+        photo = PhotoAI(executor, options)
 
+        def validate_params():
+            gp.validate_params(model="std", scale=2, denoise=50)
+            video.validate_params(model="amq-13", scale=2, quality=18)
+            photo.validate_params(format="jpg", quality=95)
             return True
 
-        result = benchmark(validate_params)
+        result = benchmark.pedantic(validate_params, iterations=1000, rounds=5, warmup_rounds=1)
         assert result is True
 
-    @pytest.mark.benchmark
+    @pytest.mark.benchmark(group="products")
     def test_command_building_benchmark(self, benchmark):
         """Benchmark command building performance."""
 
-        def build_commands():
-            executor = Mock()
-            options = ProcessingOptions()
-
-            with patch(
-                "topyaz.products.gigapixel.api.GigapixelAI.find_executable", return_value=Path("/fake/gigapixel")
-            ):
-                gp = GigapixelAI(executor, options)
-                gp_cmd = gp.build_command(Path("input.jpg"), Path("output.jpg"), model="std", scale=2, denoise=50)
-
-            with patch("topyaz.products.video_ai.api.VideoAI.find_executable", return_value=Path("/fake/ffmpeg")):
-                video = VideoAI(executor, options)
-                video_cmd = video.build_command(
-                    Path("input.mp4"), Path("output.mp4"), model="amq-13", scale=2, quality=18
-                )
-
-            with patch("topyaz.products.photo_ai.api.PhotoAI.find_executable", return_value=Path("/fake/tpai")):
-                photo = PhotoAI(executor, options)
-                photo_cmd = photo.build_command(Path("input.jpg"), Path("output.jpg"), format="jpg", quality=95)
+        executor = Mock()
+        options = ProcessingOptions()
+        gp = GigapixelAI(executor, options)
+        video = VideoAI(executor, options)
+        photo = PhotoAI(executor, options)
 
+        def build_commands():
+            gp_cmd = gp.build_command(Path("input.jpg"), Path("output.jpg"), model="std", scale=2, denoise=50)
+            video_cmd = video.build_command(Path("input.mp4"), Path("output.mp4"), model="amq-13", scale=2, quality=18)
+            photo_cmd = photo.build_command(Path("input.jpg"), Path("output.jpg"), format="jpg", quality=95)
             return gp_cmd, video_cmd, photo_cmd
 
-        result = benchmark(build_commands)
+        result = benchmark.pedantic(build_commands, iterations=1000, rounds=5, warmup_rounds=1)
         assert len(result) == 3
 
-    @pytest.mark.benchmark
+    @pytest.mark.benchmark(group="products")
     def test_output_parsing_benchmark(self, benchmark):
         """Benchmark output parsing performance."""
 
-        def parse_outputs():
-            executor = Mock()
-            options = ProcessingOptions()
-
-            # Sample outputs for parsing
-            gp_stdout = "Model: std\nScale: 2x\nProcessing time: 10.5s\nMemory used: 1024MB"
-            video_stdout = "frame= 1000 fps= 30 q=18.0 size= 1024kB time=00:00:33.33 bitrate= 251.2kbits/s speed=1.0x"
-            photo_stdout = "Processing completed successfully\nOutput saved to: output.jpg\nFile size: 1024KB"
+        executor = Mock()
+        options = ProcessingOptions()
+        # Bind the parsers once so the measured run is only the parse calls
+        gp_parse = GigapixelAI(executor, options).parse_output
+        video_parse = VideoAI(executor, options).parse_output
+        photo_parse = PhotoAI(executor, options).parse_output
 
-            with patch(
-                "topyaz.products.gigapixel.api.GigapixelAI.find_executable", return_value=Path("/fake/gigapixel")
-            ):
-                gp = GigapixelAI(executor, options)
-                gp_parsed = gp.parse_output(gp_stdout, "")
+        # Sample outputs for parsing
+        gp_stdout = "Model: std\nScale: 2x\nProcessing time: 10.5s\nMemory used: 1024MB"
+        video_stdout = "frame= 1000 fps= 30 q=18.0 size= 1024kB time=00:00:33.33 bitrate= 251.2kbits/s speed=1.0x"
+        photo_stdout = "Processing completed successfully\nOutput saved to: output.jpg\nFile size: 1024KB"
 
-            with patch("topyaz.products.video_ai.api.VideoAI.find_executable", return_value=Path("/fake/ffmpeg")):
-                video = VideoAI(executor, options)
-                video_parsed = video.parse_output(video_stdout, "")
-
-            with patch("topyaz.products.photo_ai.api.PhotoAI.find_executable", return_value=Path("/fake/tpai")):
-                photo = PhotoAI(executor, options)
-                photo_parsed = photo.parse_output(photo_stdout, "")
-
-            return gp_parsed, video_parsed, photo_parsed
+        def parse_outputs():
+            return gp_parse(gp_stdout, ""), video_parse(video_stdout, ""), photo_parse(photo_stdout, "")
 
-        result = benchmark(parse_outputs)
+        result = benchmark.pedantic(parse_outputs, iterations=1000, rounds=5, warmup_rounds=1)
         assert len(result) == 3
 
-    @pytest.mark.benchmark
-    def test_dry_run_processing_benchmark(self, benchmark):
+    @pytest.mark.benchmark(group="products")
+    def test_dry_run_processing_benchmark(self, benchmark, dry_run_inputs: tuple[str, str]):
         """Benchmark dry run processing performance."""
+        image_file, video_file = dry_run_inputs
+        # CLI construction and lazy product loading are setup, not part of the measured run
+        cli = TopyazCLI(verbose=False, dry_run=True)
+        gigapixel, video_ai, photo_ai = cli._gigapixel, cli._video_ai, cli._photo_ai
 
         def dry_run_process():
-            cli = TopyazCLI(verbose=False, dry_run=True)
-
-            # Each product validates the input extension, so the video product
-            # needs a real video file rather than the image used by the others.
-            with (
-                tempfile.NamedTemporaryFile(suffix=".jpg", delete=False) as image_file,
-                tempfile.NamedTemporaryFile(suffix=".mp4", delete=False) as video_file,
-            ):
-                gp_result = cli._gigapixel.process(image_file.name, output="gp_output.jpg", model="std", scale=2)
-                video_result = cli._video_ai.process(
-                    video_file.name, output="video_output.mp4", model="amq-13", scale=2
-                )
-                photo_result = cli._photo_ai.process(
-                    image_file.name, output="photo_output.jpg", format="jpg", quality=95
-                )
+            gp_result = gigapixel.process(image_file, output="gp_output.jpg", model="std", scale=2)
+            video_result = video_ai.process(video_file, output="video_output.mp4", model="amq-13", scale=2)
+            photo_result = photo_ai.process(image_file, output="photo_output.jpg", format="jpg", quality=95)
 
             return gp_result, video_result, photo_result
 
-        result = benchmark(dry_run_process)
+        result = benchmark.pedantic(dry_run_process, iterations=10, rounds=3, warmup_rounds=1)
         assert len(result) == 3
         assert all(r.success for r in result)
 
-    @pytest.mark.benchmark
+    @pytest.mark.benchmark(group="system")
     def test_system_info_benchmark(self, benchmark):
         """Benchmark system information gathering performance."""
 
+        # The managers keep per-instance caches of their OS probes. Build them once and
+        # warm them up so the benchmark measures steady-state lookups, not cold probes.
+        environment, gpu, memory = EnvironmentValidator(), GPUManager(), MemoryManager()
+
         def gather_system_info():
-            return (
-                EnvironmentValidator().get_system_info(),
-                GPUManager().get_status(),
-                MemoryManager().check_constraints(),
-            )
+            return environment.get_system_info(), gpu.get_status(), memory.check_constraints()
 
+        gather_system_info()
         result = benchmark(gather_system_info)
         assert len(result) == 3
 
-    @pytest.mark.benchmark
-    def test_validation_utils_benchmark(self, benchmark):
+    @pytest.mark.benchmark(group="system")
+    def test_validation_utils_benchmark(self, benchmark, tmp_path_factory: pytest.TempPathFactory):
         """Benchmark output-file validation utilities performance."""
+        bench_dir = tmp_path_factory.mktemp("validation")
+        input_path = bench_dir / "input.jpg"
+        input_path.write_bytes(b"input-bytes")
+        output_paths = [bench_dir / name for name in ("out1.jpg", "out2.png", "out3.mp4")]
+        for output_path in output_paths:
+            output_path.write_bytes(b"output-bytes")
+        # Also validate a missing output to exercise the error path.
+        output_paths.append(bench_dir / "missing.jpg")
 
         def validate_files():
-            with tempfile.TemporaryDirectory() as temp_dir:
-                temp_path = Path(temp_dir)
-                input_path = temp_path / "input.jpg"
-                input_path.write_bytes(b"input-bytes")
-
-                results = []
-                for name in ("out1.jpg", "out2.png", "out3.mp4"):
-                    output_path = temp_path / name
-                    output_path.write_bytes(b"output-bytes")
-                    results.append(validate_output_file(input_path, output_path))
-
-                # Also validate a missing output to exercise the error path.
-                results.append(validate_output_file(input_path, temp_path / "missing.jpg"))
-
+            results = [validate_output_file(input_path, output_path) for output_path in output_paths]
             return all(isinstance(r, dict) for r in results)
 
         result = benchmark(validate_files)
         assert result is True
 
-    @pytest.mark.benchmark
+    @pytest.mark.benchmark(group="startup")
     def test_executor_initialization_benchmark(self, benchmark):
         """Benchmark executor initialization performance."""
 
@@ -223,7 +212,7 @@ class TestBenchmarks:
         result = benchmark(init_executor)
         assert result is not None
 
-    @pytest.mark.benchmark
+    @pytest.mark.benchmark(group="startup")
     def test_multiple_cli_instances_benchmark(self, benchmark):
         """Benchmark multiple CLI instance creation."""
 
@@ -234,31 +223,19 @@ class TestBenchmarks:
                 instances.append(cli)
             return instances
 
-        result = benchmark(create_multiple_clis)
+        result = benchmark.pedantic(create_multiple_clis, iterations=10, rounds=3, warmup_rounds=1)
         assert len(result) == 10
 
-    @pytest.mark.benchmark
-    def test_parameter_validation_stress_benchmark(self, benchmark):
+    @pytest.mark.benchmark(group="products")
+    @pytest.mark.parametrize("combinations", STRESS_WORKLOADS)
+    def test_parameter_validation_stress_benchmark(self, benchmark, combinations: tuple[tuple[str, int, int], ...]):
         """Benchmark parameter validation under stress."""
 
+        gp = GigapixelAI(Mock(), ProcessingOptions())
+
         def stress_validation():
-            executor = Mock()
-            options = ProcessingOptions()
-
-            with patch(
-                "topyaz.products.gigapixel.api.GigapixelAI.find_executable", return_value=Path("/fake/gigapixel")
-            ):
-                gp = GigapixelAI(executor, options)
-
-                # Test many parameter combinations
-                models = ["std", "art", "low"]
-                scales = [1, 2, 3, 4, 5, 6]
-                denoises = [1, 25, 50, 75, 100]
-
-                for model in models:
-                    for scale in scales:
-                        for denoise in denoises:
-                            gp.validate_params(model=model, scale=scale, denoise=denoise)
+            for model, scale, denoise in combinations:
+                gp.validate_params(model=model, scale=scale, denoise=denoise)
 
             return True
 
@@ -4,10 +4,43 @@
 Tests for the main CLI interface in topyaz.cli.
 """
 
-import tempfile
+import threading
+from pathlib import Path
 from unittest.mock import Mock, patch
 
+import pytest
+
 from topyaz.cli import TopyazCLI
+from topyaz.products.gigapixel import GigapixelAI
+from topyaz.products.photo_ai import PhotoAI
+from topyaz.products.video_ai import VideoAI
+
+
+@pytest.fixture(scope="module")
+def default_cli() -> TopyazCLI:
+    """One default-options CLI shared by the tests that do not depend on a fresh instance."""
+    return TopyazCLI()
+
+
+@pytest.fixture
+def mock_giga_process():
+    """Replace GigapixelAI.process with a mock returning a successful result."""
+    with patch.object(GigapixelAI, "process", return_value=Mock(success=True)) as mock_process:
+        yield mock_process
+
+
+@pytest.fixture
+def mock_video_process():
+    """Replace VideoAI.process with a mock returning a successful result."""
+    with patch.object(VideoAI, "process", return_value=Mock(success=True)) as mock_process:
+        yield mock_process
+
+
+@pytest.fixture
+def mock_photo_process():
+    """Replace PhotoAI.process with a mock returning a successful result."""
+    with patch.object(PhotoAI, "process", return_value=Mock(success=True)) as mock_process:
+        yield mock_process
 
 
 class TestTopyazCLI:
@@ -48,61 +81,67 @@ class TestTopyazCLI:
         assert cli._video_ai is video
         assert cli._photo_ai is photo
 
-    def test_backward_compatibility_methods(self):
+    def test_backward_compatibility_methods(self, default_cli: TopyazCLI):
         """Test backward compatibility method names."""
-        cli = TopyazCLI()
+        # These methods should exist and be callable for backward compatibility
+        for name in ("giga", "video", "photo", "_sysinfo"):
+            assert callable(getattr(default_cli, name, None)), f"missing or non-callable {name}"
 
-        # These methods should exist for backward compatibility
-        assert hasattr(cli, "giga")
-        assert hasattr(cli, "video")
-        assert hasattr(cli, "photo")
-        assert hasattr(cli, "_sysinfo")
-
-        # They should be callable
-        assert callable(cli.giga)
-        assert callable(cli.video)
-        assert callable(cli.photo)
-        assert callable(cli._sysinfo)
-
-    @patch("topyaz.products.gigapixel.api.GigapixelAI.process")
-    def test_giga_method_delegation(self, mock_process):
+    def test_giga_method_delegation(self, default_cli: TopyazCLI, mock_giga_process: Mock, tmp_path: Path):
         """Test that giga method properly delegates to GigapixelAI."""
-        cli = TopyazCLI()
-        mock_process.return_value = Mock(success=True)
+        input_file = tmp_path / "input.jpg"
+        input_file.touch()
 
-        with tempfile.NamedTemporaryFile(suffix=".jpg") as temp_file:
-            cli.giga(temp_file.name, output="output.jpg", model="std", scale=2)
-            mock_process.assert_called_once()
+        default_cli.giga(str(input_file), output="output.jpg", model="std", scale=2)
 
-    @patch("topyaz.products.video_ai.api.VideoAI.process")
-    def test_video_method_delegation(self, mock_process):
+        mock_giga_process.assert_called_once()
+
+    def test_video_method_delegation(self, default_cli: TopyazCLI, mock_video_process: Mock, tmp_path: Path):
         """Test that video method properly delegates to VideoAI."""
-        cli = TopyazCLI()
-        mock_process.return_value = Mock(success=True)
+        input_file = tmp_path / "input.mp4"
+        input_file.touch()
 
-        with tempfile.NamedTemporaryFile(suffix=".mp4") as temp_file:
-            cli.video(temp_file.name, output="output.mp4", model="amq-13", scale=2)
-            mock_process.assert_called_once()
+        default_cli.video(str(input_file), output="output.mp4", model="amq-13", scale=2)
 
-    @patch("topyaz.products.photo_ai.api.PhotoAI.process")
-    def test_photo_method_delegation(self, mock_process):
+        mock_video_process.assert_called_once()
+
+    def test_photo_method_delegation(self, default_cli: TopyazCLI, mock_photo_process: Mock, tmp_path: Path):
         """Test that photo method properly delegates to PhotoAI."""
-        cli = TopyazCLI()
-        mock_process.return_value = Mock(success=True)
+        input_file = tmp_path / "input.jpg"
+        input_file.touch()
 
-        with tempfile.NamedTemporaryFile(suffix=".jpg") as temp_file:
-            cli.photo(temp_file.name, output="output.jpg", format="jpg", quality=95)
-            mock_process.assert_called_once()
+        default_cli.photo(str(input_file), output="output.jpg", format="jpg", quality=95)
 
-    def test_sysinfo_method(self):
-        """Test the system information method."""
-        cli = TopyazCLI()
+        mock_photo_process.assert_called_once()
 
+    def test_sysinfo_method(self, default_cli: TopyazCLI):
+        """Test the system information method."""
         # Should return system info without errors
-        result = cli._sysinfo()
+        result = default_cli._sysinfo()
         assert result is not None
         # The actual implementation may vary, but it should not raise exceptions
 
+    def test_version_probes_run_concurrently(self, default_cli: TopyazCLI, monkeypatch: pytest.MonkeyPatch):
+        """Product version probes overlap; a serial run would break the barrier."""
+        barrier = threading.Barrier(3, timeout=5)
+
+        def probe(version: str):
+            def get_version():
+                barrier.wait()
+                return version
+
+            return get_version
+
+        monkeypatch.setattr(default_cli._gigapixel, "get_version", probe("7.0"))
+        monkeypatch.setattr(default_cli._video_ai, "get_version", probe("5.0"))
+        monkeypatch.setattr(default_cli._photo_ai, "get_version", probe(None))
+
+        versions = default_cli.version()
+
+        assert versions["_gigapixel"] == "7.0"
+        assert versions["_video_ai"] == "5.0"
+        assert versions["_photo_ai"] == "unknown"
+
     def test_dry_run_propagation(self):
         """Test that dry_run option is properly propagated to products."""
         cli = TopyazCLI(dry_run=True)
@@ -11,6 +11,7 @@ output-path generation. These tests target that real API.
 
 import platform
 from pathlib import Path
+from types import SimpleNamespace
 from unittest.mock import Mock, patch
 
 import pytest
@@ -18,7 +19,8 @@ import pytest
 from topyaz.core.errors import ValidationError
 from topyaz.core.types import GPUInfo, GPUStatus, MemoryConstraints, Product
 from topyaz.system.environment import EnvironmentValidator
-from topyaz.system.gpu import GPUManager, MetalGPUDetector
+from topyaz.system.gpu import GPU_TOOLS, GPUManager, MetalGPUDetector, NvidiaGPUDetector, get_gpu_tools
+from topyaz.system.host import get_platform_info
 from topyaz.system.memory import MemoryManager
 from topyaz.system.paths import PathValidator
 
@@ -61,6 +63,39 @@ class TestEnvironmentValidator:
         assert set(results) >= {"os_version", "memory", "disk_space", "gpu"}
         assert all(isinstance(v, bool) for v in results.values())
 
+    def test_platform_probed_once(self):
+        """OS checks and the system report share one platform reading per process."""
+        get_platform_info.cache_clear()
+        try:
+            with patch("topyaz.system.host.platform.version", return_value="10.0.19045") as mock_version:
+                validator = EnvironmentValidator()
+                info = validator.get_system_info()
+                validator._validate_windows_version(raise_on_error=False)
+                EnvironmentValidator().get_system_info()
+        finally:
+            get_platform_info.cache_clear()
+
+        assert info["platform"]["version"] == "10.0.19045"
+        assert "mac_version" not in info["platform"]
+        assert mock_version.call_count == 1
+
+    def test_info_and_validation_share_psutil_readings(self):
+        """System info followed by validation reads memory and home disk usage once."""
+        fake_memory = Mock(total=32 * 1024**3, available=16 * 1024**3, percent=50.0)
+        fake_disk = Mock(total=500 * 1024**3, free=200 * 1024**3, percent=60.0)
+        validator = EnvironmentValidator()
+
+        with (
+            patch("psutil.virtual_memory", return_value=fake_memory) as vm,
+            patch("psutil.disk_usage", return_value=fake_disk) as du,
+        ):
+            validator.get_system_info()
+            validator.validate_memory(raise_on_error=False)
+            validator.validate_disk_space(raise_on_error=False)
+
+        assert vm.call_count == 1
+        assert du.call_count == 1
+
 
 class TestGPUManager:
     """Test GPU detection via GPUManager."""
@@ -99,6 +134,107 @@ class TestGPUManager:
         assert status.count == 1
         assert status.devices[0].name == "Test GPU"
 
+    def test_gpu_tools_probed_once(self):
+        """PATH lookups for vendor tools happen once, however many managers are built."""
+        get_gpu_tools.cache_clear()
+        try:
+            with patch("topyaz.system.gpu.shutil.which", return_value=None) as mock_which:
+                first = get_gpu_tools()
+                second = get_gpu_tools()
+        finally:
+            get_gpu_tools.cache_clear()
+
+        assert first is second
+        assert set(first) == set(GPU_TOOLS)
+        assert not any(first.values())
+        assert mock_which.call_count == len(GPU_TOOLS)
+        with pytest.raises(TypeError):
+            first["nvidia-smi"] = True  # type: ignore[index]
+
+    def test_nvidia_detector_parses_csv(self):
+        """nvidia-smi CSV rows become devices; "[N/A]" fields map to None."""
+        csv_output = (
+            "NVIDIA GeForce RTX 3090, 24576, 1024, 23552, 5, 45, 30.50\n"
+            "NVIDIA RTX A2000 Laptop GPU, 4096, 0, 4096, 0, 40, [N/A]\n"
+        )
+        tools = dict.fromkeys(GPU_TOOLS, True)
+
+        with (
+            patch("topyaz.system.gpu.load_nvml", return_value=None),
+            patch("topyaz.system.gpu.get_gpu_tools", return_value=tools),
+            patch.object(NvidiaGPUDetector, "_run_command", return_value=(True, csv_output, "")) as mock_run,
+        ):
+            status = NvidiaGPUDetector().detect()
+
+        assert "--format=csv,noheader,nounits" in mock_run.call_args.args[0]
+        assert status.count == 2
+        assert status.devices[0].name == "NVIDIA GeForce RTX 3090"
+        assert status.devices[0].memory_free_mb == 23552
+        assert status.devices[0].power_draw_w == pytest.approx(30.5)
+        assert status.devices[1].power_draw_w is None
+        assert status.devices[1].device_id == 1
+
+    def test_nvidia_detector_prefers_nvml(self):
+        """With NVML available, devices are read in-process and nvidia-smi is not run."""
+
+        class FakeNVMLError(Exception):
+            pass
+
+        nvml = SimpleNamespace(
+            NVMLError=FakeNVMLError,
+            NVML_TEMPERATURE_GPU=0,
+            nvmlDeviceGetCount=Mock(return_value=1),
+            nvmlDeviceGetHandleByIndex=Mock(return_value="handle0"),
+            nvmlDeviceGetName=Mock(return_value=b"NVIDIA GeForce RTX 3090"),
+            nvmlDeviceGetMemoryInfo=Mock(
+                return_value=SimpleNamespace(total=24576 * 1024**2, used=1024 * 1024**2, free=23552 * 1024**2)
+            ),
+            nvmlDeviceGetUtilizationRates=Mock(return_value=SimpleNamespace(gpu=5)),
+            nvmlDeviceGetTemperature=Mock(return_value=45),
+            nvmlDeviceGetPowerUsage=Mock(side_effect=FakeNVMLError),
+        )
+
+        with (
+            patch("topyaz.system.gpu.load_nvml", return_value=nvml),
+            patch.object(NvidiaGPUDetector, "_run_command") as mock_run,
+        ):
+            status = NvidiaGPUDetector().detect()
+
+        mock_run.assert_not_called()
+        assert status.count == 1
+        device = status.devices[0]
+        assert device.name == "NVIDIA GeForce RTX 3090"
+        assert device.memory_total_mb == 24576
+        assert device.memory_free_mb == 23552
+        assert device.utilization_percent == 5
+        assert device.temperature_c == 45
+        assert device.power_draw_w is None
+
+    def test_nvidia_detector_nvml_skips_failing_device(self):
+        """An NVML error on one device handle is reported without dropping the other devices."""
+
+        class FakeNVMLError(Exception):
+            pass
+
+        nvml = SimpleNamespace(
+            NVMLError=FakeNVMLError,
+            NVML_TEMPERATURE_GPU=0,
+            nvmlDeviceGetCount=Mock(return_value=2),
+            nvmlDeviceGetHandleByIndex=Mock(side_effect=[FakeNVMLError("GPU is lost"), "handle1"]),
+            nvmlDeviceGetName=Mock(return_value="NVIDIA RTX A2000"),
+            nvmlDeviceGetMemoryInfo=Mock(side_effect=FakeNVMLError),
+            nvmlDeviceGetUtilizationRates=Mock(side_effect=FakeNVMLError),
+            nvmlDeviceGetTemperature=Mock(side_effect=FakeNVMLError),
+            nvmlDeviceGetPowerUsage=Mock(side_effect=FakeNVMLError),
+        )
+
+        with patch("topyaz.system.gpu.load_nvml", return_value=nvml):
+            status = NvidiaGPUDetector().detect()
+
+        assert status.available is True
+        assert [(d.name, d.device_id) for d in status.devices] == [("NVIDIA RTX A2000", 1)]
+        assert status.errors == ["NVML query failed for device 0: GPU is lost"]
+
     def test_metal_detector_off_darwin_reports_unavailable(self):
         """The Metal detector reports unavailable when not on macOS."""
         with patch("topyaz.system.gpu.platform.system", return_value="Linux"):
@@ -107,6 +243,23 @@ class TestGPUManager:
         assert status.available is False
         assert status.errors
 
+    def test_metal_detector_probes_system_profiler_once(self, monkeypatch: pytest.MonkeyPatch):
+        """The slow system_profiler probe is shared across Metal detector instances."""
+        monkeypatch.setattr(MetalGPUDetector, "_cached_devices", None)
+        profiler_json = '{"SPDisplaysDataType": [{"sppci_model": "Apple M2", "spdisplays_vram": "8 GB"}]}'
+
+        with (
+            patch("topyaz.system.gpu.platform.system", return_value="Darwin"),
+            patch.object(MetalGPUDetector, "_run_command", return_value=(True, profiler_json, "")) as mock_run,
+        ):
+            first = MetalGPUDetector().detect()
+            second = MetalGPUDetector().detect()
+
+        assert mock_run.call_count == 1
+        assert first.devices[0].name == second.devices[0].name == "Apple M2"
+        assert second.devices[0].memory_total_mb == 8192
+        assert first.devices[0] is not second.devices[0]
+
 
 class TestMemoryManager:
     """Test memory reporting via MemoryManager."""
@@ -127,12 +280,29 @@ class TestMemoryManager:
         fake_memory.available = 1 * 1024**3  # 1 GB available -> low
         fake_memory.percent = 95.0
 
-        with patch("topyaz.system.memory.psutil.virtual_memory", return_value=fake_memory):
+        with patch("psutil.virtual_memory", return_value=fake_memory):
             constraints = MemoryManager().check_constraints(Product.PHOTO_AI)
 
         assert constraints.available_gb == pytest.approx(1.0)
         assert constraints.recommendations
 
+    def test_memory_snapshot_reused_within_ttl(self):
+        """Back-to-back sizing checks share one psutil reading until the TTL lapses."""
+        fake_memory = Mock(total=32 * 1024**3, available=16 * 1024**3, percent=50.0)
+        manager = MemoryManager()
+
+        with (
+            patch("psutil.virtual_memory", return_value=fake_memory) as vm,
+            patch("topyaz.system.memory.time.monotonic", side_effect=[100.0, 100.5, 100.9, 101.5]),
+        ):
+            manager.check_constraints(Product.GIGAPIXEL)
+            manager.get_optimal_batch_size(10, Product.GIGAPIXEL)
+            manager.can_process_batch(2, Product.GIGAPIXEL)
+            assert vm.call_count == 1
+
+            manager.check_constraints(Product.GIGAPIXEL)
+            assert vm.call_count == 2
+
     def test_optimal_batch_size_never_exceeds_file_count(self):
         """The optimal batch size is clamped to the file count."""
         batch = MemoryManager().get_optimal_batch_size(3, Product.GIGAPIXEL)
@@ -143,6 +313,21 @@ class TestMemoryManager:
         """Zero files yields a zero batch size."""
         assert MemoryManager().get_optimal_batch_size(0) == 0
 
+    @pytest.mark.parametrize(
+        ("error_message", "is_memory_error"),
+        [
+            ("CUDA error: OUT OF MEMORY", True),
+            ("Failed to allocate 2048 MB", True),
+            ("Process killed (OOM)", True),
+            ("No such file or directory", False),
+        ],
+    )
+    def test_suggest_recovery_action_classifies_memory_errors(self, error_message, is_memory_error):
+        """Memory errors are recognised case-insensitively; others get no suggestions."""
+        suggestions = MemoryManager().suggest_recovery_action(error_message, Product.VIDEO_AI)
+
+        assert bool(suggestions) is is_memory_error
+
 
 class TestPathValidator:
     """Test path validation and output-path generation."""
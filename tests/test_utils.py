@@ -9,11 +9,14 @@ and video metadata, ``compare_media_files`` diffs input vs output, and
 ``enhance_processing_result`` augments a ProcessingResult with validation data.
 """
 
+import subprocess
+import sys
 from pathlib import Path
 
 import pytest
 from PIL import Image
 
+import topyaz.utils
 from topyaz.core.types import ProcessingResult
 from topyaz.utils.logging import setup_logging
 from topyaz.utils.validation import (
@@ -161,3 +164,20 @@ class TestLoggingUtils:
         """setup_logging runs in both verbose and quiet modes without error."""
         setup_logging(verbose=True)
         setup_logging(verbose=False)
+
+
+class TestUtilsPackage:
+    """Test the topyaz.utils package exports."""
+
+    def test_validation_helpers_reexported(self):
+        """Validation helpers resolve lazily to the validation module's functions."""
+        assert topyaz.utils.validate_output_file is validate_output_file
+        assert topyaz.utils.compare_media_files is compare_media_files
+        assert topyaz.utils.enhance_processing_result is enhance_processing_result
+
+    def test_logging_import_does_not_load_validation(self):
+        """Importing the logging helpers leaves Pillow-backed validation unloaded."""
+        code = "import sys, topyaz.utils.logging; print('topyaz.utils.validation' in sys.modules)"
+        result = subprocess.run([sys.executable, "-c", code], capture_output=True, text=True, check=True)  # noqa: S603
+
+        assert result.stdout.strip() == "False"